@@ -4,40 +4,56 @@ bl_info = {
     "version": (2, 8, 2),
     "blender": (4, 2, 0),
     "location": "Node Editor > Right Click Menu / Sidebar > LuxCore Tools / View3D > Object Context Menu",
-    "description": """Tools to speed up setup, conversion and management of materials for LuxCore:
-• Automatic PBR Disney setup with PBR textures
-• Texture extraction from Cycles/Eevee materials
-• Transfer Principled BSDF values to Disney node
-• Separate handling for Normal maps and Bump maps
-• Reset Emission Strength and connect existing textures""",
+    "description": "Tools to speed up setup, conversion and management of materials for LuxCore",
     "category": "Material",
     "support": "COMMUNITY",
 }
 
-def register():
-    # Import and register submodules here, to avoid circular import
-    from . import luxcore_disney_setup
-    luxcore_disney_setup.register()
-
-    from . import luxcore_texture_extractor
-    luxcore_texture_extractor.register()
+import importlib
+import sys
+
+# Submodules in registration order
+_SUBMODULE_NAMES = (
+    "luxcore_disney_setup",
+    "luxcore_texture_extractor",
+    "luxcore_texture_connect",
+    "luxcore_connect_selected",
+)
+_LAZY_SUBMODULES = frozenset(_SUBMODULE_NAMES)
+
+def __getattr__(name):
+    # Import submodules on first access only, so scanning bl_info stays cheap
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module("." + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Submodules whose register() succeeded, in registration order
+_REGISTERED = []
+
+def _rollback():
+    """Unregister the submodules registered so far, ignoring their errors"""
+    while _REGISTERED:
+        module = _REGISTERED.pop()
+        try:
+            module.unregister()
+        except Exception:
+            pass
 
-    from . import luxcore_texture_connect
-    luxcore_texture_connect.register()
-
-    from . import luxcore_connect_selected
-    luxcore_connect_selected.register()
+def register():
+    package = sys.modules[__name__]
+    try:
+        for name in _SUBMODULE_NAMES:
+            module = getattr(package, name)
+            module.register()
+            _REGISTERED.append(module)
+    except Exception:
+        # Roll back what was registered so a retry starts from a clean state
+        _rollback()
+        raise
 
 def unregister():
-    # Import and unregister in reverse order
-    from . import luxcore_connect_selected
-    luxcore_connect_selected.unregister()
-
-    from . import luxcore_texture_connect
-    luxcore_texture_connect.unregister()
-
-    from . import luxcore_texture_extractor
-    luxcore_texture_extractor.unregister()
-
-    from . import luxcore_disney_setup
-    luxcore_disney_setup.unregister()
+    # Unregister in reverse order, only the submodules that registered
+    while _REGISTERED:
+        _REGISTERED.pop().unregister()
@@ -10,10 +10,126 @@ bl_info = {
 }
 
 import bpy
-import re
 from bpy.types import Operator, Menu
 from bpy.props import StringProperty, EnumProperty
 
+# Print debug messages and full tracebacks for errors caught inside the operator
+_DEBUG = False
+
+# Sentinel for single-lookup getattr() checks on optional node attributes
+_MISSING = object()
+
+# Image texture nodes the operator can be invoked on
+_TEXTURE_NODE_TYPES = frozenset((
+    'LuxCoreNodeTexImagemap',
+    'LuxCoreNodeTexImage',
+    'ShaderNodeTexImage',
+))
+
+_DISNEY_NODE_TYPES = frozenset((
+    'LuxCoreNodeMatDisney',
+    'LuxCoreNodeMatDisney2',
+    'luxcore_material_disney',
+))
+
+# Candidate node types in order of preference, resolved once per session
+_MATH_NODE_TYPES = (
+    'LuxCoreNodeTexMath',
+    'LuxCoreNodeMath',
+    'LuxCoreNodeTexMix',
+    'LuxCoreNodeTexMixColor',
+    'luxcore_tex_math',
+    'luxcore_tex_mix',
+)
+
+_DISPLACEMENT_NODE_TYPES = (
+    'LuxCoreNodeShapeHeightDisplacement',
+    'LuxCoreNodeMatHeightDisplacement',
+    'LuxCoreNodeMatDisplacement',
+    'LuxCoreNodeDisplacement',
+    'luxcore_material_height_displacement',
+    'luxcore_material_displacement',
+)
+
+_SPLIT3_NODE_TYPE = 'LuxCoreNodeTexSplitFloat3'
+_CONST3_NODE_TYPE = 'LuxCoreNodeTexConstantFloat3'
+
+def _first_available_node_type(candidates):
+    """Return the first candidate bl_idname registered in bpy.types"""
+    for node_type in candidates:
+        if hasattr(bpy.types, node_type):
+            return node_type
+    return None
+
+def _multiply_operation_prop(node_type):
+    """Return the writable enum property of node_type that accepts 'MULTIPLY', if any"""
+    properties = getattr(bpy.types, node_type).bl_rna.properties
+    for prop_name in ('operation', 'blend_type', 'type', 'mode'):
+        prop = properties.get(prop_name)
+        if (prop and prop.type == 'ENUM' and not prop.is_readonly
+                and 'MULTIPLY' in prop.enum_items.keys()):
+            return prop_name
+    return None
+
+# Candidate texture-node properties for normal maps, in order of preference
+_NORMAL_MAP_PROPS = (
+    'normalmap', 'normal_map', 'use_normalmap', 'use_normal_map',
+    'is_normalmap', 'is_normal_map', 'normal', 'as_normal',
+    'use_as_normalmap',
+)
+
+_NORMAL_STRENGTH_PROPS = (
+    'bump_height', 'height', 'strength', 'normal_strength',
+    'normal_scale', 'scale', 'value', 'intensity',
+)
+
+# Node class -> (normal-map toggle property, strength property), either may be None
+_NORMAL_SETTER_CACHE = {}
+
+def _first_writable_prop(properties, candidates, prop_types):
+    """Return the first candidate that is a writable RNA property of one of prop_types"""
+    for prop_name in candidates:
+        prop = properties.get(prop_name)
+        if prop and not prop.is_readonly and prop.type in prop_types:
+            return prop_name
+    return None
+
+def _normal_map_setters(node_class):
+    """Resolve, once per node class, which properties enable a normal map and set its strength"""
+    setters = _NORMAL_SETTER_CACHE.get(node_class)
+    if setters is None:
+        properties = node_class.bl_rna.properties
+        setters = (
+            _first_writable_prop(properties, _NORMAL_MAP_PROPS, {'BOOLEAN'}),
+            _first_writable_prop(properties, _NORMAL_STRENGTH_PROPS, {'FLOAT', 'INT'}),
+        )
+        _NORMAL_SETTER_CACHE[node_class] = setters
+    return setters
+
+_OUTPUT_PREFS = ('Color', 'Image', 'Value', 'Result')
+
+def _pick_output(outputs):
+    """Return the first preferred output by name, falling back to the first output"""
+    for name in _OUTPUT_PREFS:
+        socket = outputs.get(name)
+        if socket is not None:
+            return socket
+    return outputs[0] if len(outputs) > 0 else None
+
+def _socket_map(sockets):
+    """Map lowercase socket names to sockets (first socket wins on duplicates)"""
+    sockets_by_name = {}
+    for socket in sockets:
+        sockets_by_name.setdefault(socket.name.lower(), socket)
+    return sockets_by_name
+
+def _find_socket(sockets_by_name, *keywords):
+    """Return the first socket whose lowercase name contains one of the keywords"""
+    for name, socket in sockets_by_name.items():
+        if any(keyword in name for keyword in keywords):
+            return socket
+    return None
+
 class LUXCORE_OT_connect_selected_texture(Operator):
     """Connect selected texture to Disney node as specific type"""
     bl_idname = "luxcore.connect_selected_texture"
@@ -39,6 +155,27 @@ class LUXCORE_OT_connect_selected_texture(Operator):
         default='COLOR'
     )
     
+    # Node types resolved by resolve_node_types()
+    _MATH_NODE_TYPE = None
+    _MATH_OPERATION_PROP = None
+    _DISPLACEMENT_NODE_TYPE = None
+    _HAS_SPLIT3 = False
+    _HAS_CONST3 = False
+    
+    @classmethod
+    def resolve_node_types(cls):
+        """Resolve the Math, Displacement, Split and Constant node types, retrying only the ones still missing"""
+        if cls._MATH_NODE_TYPE is None:
+            cls._MATH_NODE_TYPE = _first_available_node_type(_MATH_NODE_TYPES)
+            if cls._MATH_NODE_TYPE:
+                cls._MATH_OPERATION_PROP = _multiply_operation_prop(cls._MATH_NODE_TYPE)
+        if cls._DISPLACEMENT_NODE_TYPE is None:
+            cls._DISPLACEMENT_NODE_TYPE = _first_available_node_type(_DISPLACEMENT_NODE_TYPES)
+        if not cls._HAS_SPLIT3:
+            cls._HAS_SPLIT3 = hasattr(bpy.types, _SPLIT3_NODE_TYPE)
+        if not cls._HAS_CONST3:
+            cls._HAS_CONST3 = hasattr(bpy.types, _CONST3_NODE_TYPE)
+    
     @classmethod
     def poll(cls, context):
         if not context.space_data or not context.space_data.node_tree:
@@ -48,64 +185,58 @@ class LUXCORE_OT_connect_selected_texture(Operator):
         if not node_tree.nodes.active:
             return False
         
-        active_node = node_tree.nodes.active
-        texture_node_types = [
-            'LuxCoreNodeTexImagemap',
-            'LuxCoreNodeTexImage',
-            'ShaderNodeTexImage'
-        ]
-        
-        return active_node.bl_idname in texture_node_types
+        return node_tree.nodes.active.bl_idname in _TEXTURE_NODE_TYPES
     
     def execute(self, context):
         node_tree = context.space_data.node_tree
         texture_node = node_tree.nodes.active
         
-        disney_node = None
+        # LuxCore may have been enabled after this add-on was registered
+        self.resolve_node_types()
+        
+        # Resolve once how the texture is switched to Non-Color data
+        if hasattr(texture_node, 'color_space'):
+            self._non_color_attr = 'color_space'
+        elif hasattr(texture_node, 'gamma'):
+            self._non_color_attr = 'gamma'
+        else:
+            self._non_color_attr = None
+        
+        # Index the tree once by bl_idname and by label tag ("COLOR: x" -> 'COLOR'),
+        # the first node of each kind wins
+        nodes_by_id = {}
+        self._tag_index = {}
         for node in node_tree.nodes:
-            if node.bl_idname in ['LuxCoreNodeMatDisney', 'LuxCoreNodeMatDisney2', 'luxcore_material_disney']:
-                disney_node = node
-                break
+            nodes_by_id.setdefault(node.bl_idname, node)
+            label = node.label
+            if label:
+                self._tag_index.setdefault(label.split(':', 1)[0].strip().upper(), node)
+        
+        disney_node = next((node for bl_idname, node in nodes_by_id.items()
+                            if bl_idname in _DISNEY_NODE_TYPES), None)
         
         if not disney_node:
             self.report({'ERROR'}, "No Disney node found in the tree")
             return {'CANCELLED'}
         
-        material_output = None
-        for node in node_tree.nodes:
-            if node.bl_idname == 'LuxCoreNodeMatOutput':
-                material_output = node
-                break
+        material_output = nodes_by_id.get('LuxCoreNodeMatOutput')
+        
+        # Socket maps shared by the connect_* helpers (lowercase name -> socket)
+        self._disney_inputs = _socket_map(disney_node.inputs)
+        self._texture_outputs = _socket_map(texture_node.outputs)
         
-        normal_strength = 1.0
-        displacement_height = 0.01
+        # Index existing links by destination socket, so helpers don't rescan node_tree.links
+        self._incoming_links = {link.to_socket.as_pointer(): link for link in node_tree.links}
         
-        success = False
+        extra_args = {
+            'material_output': material_output,
+            'normal_strength': 1.0,
+            'displacement_height': 0.01,
+        }
         
-        if self.texture_type == 'COLOR':
-            success = self.connect_color(node_tree, texture_node, disney_node)
-        elif self.texture_type == 'ROUGHNESS':
-            success = self.connect_roughness(node_tree, texture_node, disney_node)
-        elif self.texture_type == 'NORMAL':
-            success = self.connect_normal(node_tree, texture_node, disney_node, normal_strength)
-        elif self.texture_type == 'BUMP':
-            success = self.connect_bump(node_tree, texture_node, disney_node)
-        elif self.texture_type == 'SPECULAR':
-            success = self.connect_specular(node_tree, texture_node, disney_node)
-        elif self.texture_type == 'METALLIC':
-            success = self.connect_metallic(node_tree, texture_node, disney_node)
-        elif self.texture_type == 'OCCLUSION':
-            success = self.connect_occlusion(node_tree, texture_node, disney_node)
-        elif self.texture_type == 'HEIGHT':
-            success = self.connect_height(node_tree, texture_node, disney_node, material_output, displacement_height)
-        elif self.texture_type == 'OPACITY':
-            success = self.connect_opacity(node_tree, texture_node, disney_node)
-        elif self.texture_type == 'EMISSION':
-            success = self.connect_emission(node_tree, texture_node, disney_node)
-        elif self.texture_type == 'ORM':
-            success = self.connect_orm(node_tree, texture_node, disney_node)
-        elif self.texture_type == 'ORS':
-            success = self.connect_ors(node_tree, texture_node, disney_node)
+        connect, extra_names = self._DISPATCH[self.texture_type]
+        success = connect(self, node_tree, texture_node, disney_node,
+                          *[extra_args[name] for name in extra_names])
         
         if success:
             self.report({'INFO'}, f"Texture connected as {self.texture_type}")
@@ -114,63 +245,70 @@ class LUXCORE_OT_connect_selected_texture(Operator):
             self.report({'ERROR'}, f"Cannot connect texture as {self.texture_type}")
             return {'CANCELLED'}
     
+    def unlink_input(self, node_tree, socket):
+        """Remove the link feeding socket, found through the execute() links index"""
+        if not socket.is_linked:
+            return None
+        link = self._incoming_links.pop(socket.as_pointer(), None)
+        if link:
+            node_tree.links.remove(link)
+        return link
+    
+    def set_non_color(self, texture_node):
+        """Mark the texture as Non-Color data (color space or gamma 1.0), skipping writes that change nothing"""
+        if self._non_color_attr == 'color_space':
+            if texture_node.color_space != 'Non-Color':
+                texture_node.color_space = 'Non-Color'
+        elif self._non_color_attr == 'gamma':
+            if texture_node.gamma != 1.0:
+                texture_node.gamma = 1.0
+    
     def connect_color(self, node_tree, texture_node, disney_node):
-        if 'Base Color' in disney_node.inputs and hasattr(texture_node, 'outputs'):
-            if 'Color' in texture_node.outputs:
-                node_tree.links.new(texture_node.outputs['Color'], disney_node.inputs['Base Color'])
+        disney_input = self._disney_inputs.get('base color')
+        if disney_input:
+            color_output = self._texture_outputs.get('color')
+            if color_output:
+                node_tree.links.new(color_output, disney_input)
                 texture_node.label = f"COLOR: {texture_node.label or texture_node.name}"
                 return True
         return False
     
     def connect_roughness(self, node_tree, texture_node, disney_node):
-        if 'Roughness' in disney_node.inputs and hasattr(texture_node, 'outputs'):
-            if 'Color' in texture_node.outputs:
-                node_tree.links.new(texture_node.outputs['Color'], disney_node.inputs['Roughness'])
+        disney_input = self._disney_inputs.get('roughness')
+        if disney_input:
+            color_output = self._texture_outputs.get('color')
+            if color_output:
+                node_tree.links.new(color_output, disney_input)
                 texture_node.label = f"ROUGHNESS: {texture_node.label or texture_node.name}"
                 
-                if hasattr(texture_node, 'color_space'):
-                    texture_node.color_space = 'Non-Color'
-                elif hasattr(texture_node, 'gamma'):
-                    texture_node.gamma = 1.0
+                self.set_non_color(texture_node)
                 
                 return True
         return False
     
     def connect_normal(self, node_tree, texture_node, disney_node, normal_strength):
-        socket_names_to_try = ['Bump', 'bump', 'Normal', 'normal']
-        socket_found = None
-        
-        for socket_name in socket_names_to_try:
-            if socket_name in disney_node.inputs:
-                socket_found = disney_node.inputs[socket_name]
-                break
+        disney_inputs = self._disney_inputs
+        socket_found = (disney_inputs.get('bump') or disney_inputs.get('normal')
+                        or _find_socket(disney_inputs, 'bump', 'normal'))
         
-        if not socket_found:
-            for input_socket in disney_node.inputs:
-                if 'bump' in input_socket.name.lower() or 'normal' in input_socket.name.lower():
-                    socket_found = input_socket
-                    break
-        
-        if socket_found and hasattr(texture_node, 'outputs'):
-            if 'Color' in texture_node.outputs:
+        if socket_found:
+            color_output = self._texture_outputs.get('color')
+            if color_output:
                 if texture_node.bl_idname == 'ShaderNodeTexImage':
                     try:
                         normal_map_node = node_tree.nodes.new('ShaderNodeNormalMap')
                         normal_map_node.location = (texture_node.location.x + 200, texture_node.location.y)
-                        node_tree.links.new(texture_node.outputs['Color'], normal_map_node.inputs['Color'])
+                        node_tree.links.new(color_output, normal_map_node.inputs['Color'])
                         node_tree.links.new(normal_map_node.outputs['Normal'], socket_found)
                         normal_map_node.inputs['Strength'].default_value = normal_strength
                     except Exception as e:
-                        node_tree.links.new(texture_node.outputs['Color'], socket_found)
+                        node_tree.links.new(color_output, socket_found)
                 else:
-                    node_tree.links.new(texture_node.outputs['Color'], socket_found)
+                    node_tree.links.new(color_output, socket_found)
                 
                 texture_node.label = f"NORMAL: {texture_node.label or texture_node.name}"
                 
-                if hasattr(texture_node, 'color_space'):
-                    texture_node.color_space = 'Non-Color'
-                elif hasattr(texture_node, 'gamma'):
-                    texture_node.gamma = 1.0
+                self.set_non_color(texture_node)
                 
                 self.activate_normal_map(texture_node, normal_strength)
                 
@@ -186,55 +324,41 @@ class LUXCORE_OT_connect_selected_texture(Operator):
             bump_node.label = "Bump"
             
             # Set Sampling Distance to 0.001 and Bump Height to 0.01
-            if hasattr(bump_node, 'inputs'):
-                for inp in bump_node.inputs:
-                    inp_name = inp.name.lower()
-                    if 'sampling' in inp_name or 'distance' in inp_name:
-                        if hasattr(inp, 'default_value'):
-                            try:
-                                inp.default_value = 0.001
-                            except:
-                                pass
-                    elif 'height' in inp_name or 'bump height' in inp_name:
-                        if hasattr(inp, 'default_value'):
-                            try:
-                                inp.default_value = 0.01
-                            except:
-                                pass
+            for inp in bump_node.inputs:
+                inp_name = inp.name.lower()
+                if 'sampling' in inp_name or 'distance' in inp_name:
+                    if hasattr(inp, 'default_value'):
+                        try:
+                            inp.default_value = 0.001
+                        except:
+                            pass
+                elif 'height' in inp_name or 'bump height' in inp_name:
+                    if hasattr(inp, 'default_value'):
+                        try:
+                            inp.default_value = 0.01
+                        except:
+                            pass
             
             # Connect texture to Bump node Value input
-            if hasattr(texture_node, 'outputs') and 'Color' in texture_node.outputs:
-                value_input = None
-                for inp in bump_node.inputs:
-                    if 'value' in inp.name.lower():
-                        value_input = inp
-                        break
+            color_output = self._texture_outputs.get('color')
+            if color_output:
+                value_input = _find_socket(_socket_map(bump_node.inputs), 'value')
                 
                 if value_input:
-                    node_tree.links.new(texture_node.outputs['Color'], value_input)
+                    node_tree.links.new(color_output, value_input)
             
             # Connect Bump node to Disney Bump socket
-            socket_found = None
-            for socket_name in ['Bump', 'bump', 'Normal', 'normal']:
-                if socket_name in disney_node.inputs:
-                    socket_found = disney_node.inputs[socket_name]
-                    break
-            
-            if not socket_found:
-                for input_socket in disney_node.inputs:
-                    if 'bump' in input_socket.name.lower() or 'normal' in input_socket.name.lower():
-                        socket_found = input_socket
-                        break
+            disney_inputs = self._disney_inputs
+            socket_found = (disney_inputs.get('bump') or disney_inputs.get('normal')
+                            or _find_socket(disney_inputs, 'bump', 'normal'))
+            bump_output = _socket_map(bump_node.outputs).get('bump')
             
-            if socket_found and 'Bump' in bump_node.outputs:
-                node_tree.links.new(bump_node.outputs['Bump'], socket_found)
+            if socket_found and bump_output:
+                node_tree.links.new(bump_output, socket_found)
                 texture_node.label = f"BUMP: {texture_node.label or texture_node.name}"
                 
                 # Set Non-Color
-                if hasattr(texture_node, 'color_space'):
-                    texture_node.color_space = 'Non-Color'
-                elif hasattr(texture_node, 'gamma'):
-                    texture_node.gamma = 1.0
+                self.set_non_color(texture_node)
                 
                 return True
             
@@ -244,170 +368,136 @@ class LUXCORE_OT_connect_selected_texture(Operator):
         return False
     
     def connect_specular(self, node_tree, texture_node, disney_node):
-        if 'Specular' in disney_node.inputs and hasattr(texture_node, 'outputs'):
-            if 'Color' in texture_node.outputs:
-                node_tree.links.new(texture_node.outputs['Color'], disney_node.inputs['Specular'])
+        disney_input = self._disney_inputs.get('specular')
+        if disney_input:
+            color_output = self._texture_outputs.get('color')
+            if color_output:
+                node_tree.links.new(color_output, disney_input)
                 texture_node.label = f"SPECULAR: {texture_node.label or texture_node.name}"
                 
-                if hasattr(texture_node, 'color_space'):
-                    texture_node.color_space = 'Non-Color'
-                elif hasattr(texture_node, 'gamma'):
-                    texture_node.gamma = 1.0
+                self.set_non_color(texture_node)
                 
                 return True
         return False
     
     def connect_metallic(self, node_tree, texture_node, disney_node):
-        if 'Metallic' in disney_node.inputs and hasattr(texture_node, 'outputs'):
-            if 'Color' in texture_node.outputs:
-                node_tree.links.new(texture_node.outputs['Color'], disney_node.inputs['Metallic'])
+        disney_input = self._disney_inputs.get('metallic')
+        if disney_input:
+            color_output = self._texture_outputs.get('color')
+            if color_output:
+                node_tree.links.new(color_output, disney_input)
                 texture_node.label = f"METALLIC: {texture_node.label or texture_node.name}"
                 
-                if hasattr(texture_node, 'color_space'):
-                    texture_node.color_space = 'Non-Color'
-                elif hasattr(texture_node, 'gamma'):
-                    texture_node.gamma = 1.0
+                self.set_non_color(texture_node)
                 
                 return True
         return False
     
     def connect_occlusion(self, node_tree, texture_node, disney_node):
         """Collega la texture di Occlusione moltiplicandola con la Color texture esistente"""
-        color_input = disney_node.inputs.get('Base Color')
+        color_input = self._disney_inputs.get('base color')
         if not color_input:
             self.report({'WARNING'}, "No Base Color input found on Disney node")
             return False
         
         try:
             # 1. Trova il collegamento esistente del colore
-            existing_color_link = None
-            color_source_node = None
-            for link in node_tree.links:
-                if link.to_socket == color_input:
-                    existing_color_link = link
-                    color_source_node = link.from_node
-                    break
+            existing_color_link = self._incoming_links.get(color_input.as_pointer())
             
             if not existing_color_link:
                 self.report({'ERROR'}, "Connect a Color Texture first")
                 return False
             
+            color_source_node = existing_color_link.from_node
+            ao_output = self._texture_outputs.get('color')
+            
             # 2. Crea nodo Math per moltiplicazione (usando solo nodi LuxCore)
-            math_node_types = [
-                'LuxCoreNodeTexMath',
-                'LuxCoreNodeMath',
-                'LuxCoreNodeTexMix',
-                'LuxCoreNodeTexMixColor',
-                'luxcore_tex_math',
-                'luxcore_tex_mix',
-            ]
-            
-            math_node = None
-            for node_type in math_node_types:
-                try:
-                    math_node = node_tree.nodes.new(type=node_type)
-                    break
-                except:
-                    continue
-            
-            if not math_node:
+            if not self._MATH_NODE_TYPE:
                 self.report({'ERROR'}, "Cannot create Math node for AO multiply")
                 return False
             
+            math_node = node_tree.nodes.new(type=self._MATH_NODE_TYPE)
+            
             math_node.location = (disney_node.location.x - 250, texture_node.location.y)
-            math_node.label = "AO Multiply"
             
             # 3. Configura il nodo Math per operazione MULTIPLY
-            operation_props = ['operation', 'blend_type', 'type', 'mode']
-            for prop_name in operation_props:
-                if hasattr(math_node, prop_name):
-                    try:
-                        setattr(math_node, prop_name, 'MULTIPLY')
-                        break
-                    except:
-                        continue
-            
-            # 4. Imposta la texture AO come Non-Color
-            if hasattr(texture_node, 'color_space'):
-                texture_node.color_space = 'Non-Color'
-            elif hasattr(texture_node, 'gamma'):
-                texture_node.gamma = 1.0
+            if self._MATH_OPERATION_PROP:
+                setattr(math_node, self._MATH_OPERATION_PROP, 'MULTIPLY')
             
-            texture_node.label = f"AO: {texture_node.label or texture_node.name}"
-            
-            # 5. Collega Color texture al primo input del Math node
-            color_connected = False
-            ao_connected = False
+            # 4. Trova gli input del Math node: Color sul primo, AO sul secondo
+            color_math_input = None
+            ao_math_input = None
             
             for i, input_socket in enumerate(math_node.inputs):
-                input_name = input_socket.name.lower() if hasattr(input_socket, 'name') else ''
+                input_name = input_socket.name.lower()
                 
                 # Primo input: Color texture
-                if not color_connected and (i == 0 or 'value1' in input_name or 'input1' in input_name or 'a' in input_name or 'color1' in input_name):
-                    node_tree.links.new(existing_color_link.from_socket, input_socket)
-                    color_connected = True
-                    if color_source_node:
-                        color_source_node.label = (color_source_node.label or color_source_node.name) + " →Math"
+                if not color_math_input and (i == 0 or 'value1' in input_name or 'input1' in input_name or 'a' in input_name or 'color1' in input_name):
+                    color_math_input = input_socket
                 
                 # Secondo input: AO texture
-                elif not ao_connected and (i == 1 or 'value2' in input_name or 'input2' in input_name or 'b' in input_name or 'color2' in input_name):
-                    if 'Color' in texture_node.outputs:
-                        node_tree.links.new(texture_node.outputs['Color'], input_socket)
-                        ao_connected = True
-                        texture_node.label += " →Math"
+                elif not ao_math_input and ao_output and (i == 1 or 'value2' in input_name or 'input2' in input_name or 'b' in input_name or 'color2' in input_name):
+                    ao_math_input = input_socket
             
             # Fallback: usa i primi due input se non trovati per nome
-            if not color_connected and len(math_node.inputs) > 0:
-                node_tree.links.new(existing_color_link.from_socket, math_node.inputs[0])
-                color_connected = True
-                if color_source_node:
-                    color_source_node.label = (color_source_node.label or color_source_node.name) + " →Math"
-            
-            if not ao_connected and len(math_node.inputs) > 1:
-                if 'Color' in texture_node.outputs:
-                    node_tree.links.new(texture_node.outputs['Color'], math_node.inputs[1])
-                    ao_connected = True
-                    texture_node.label += " →Math"
-            
-            # 6. Rimuovi il collegamento esistente Color → Disney
-            node_tree.links.remove(existing_color_link)
-            
-            # 7. Collega l'output del Math node al Base Color del Disney
-            if color_connected and ao_connected:
-                output_socket = None
-                for out_socket in math_node.outputs:
-                    out_name = out_socket.name.lower() if hasattr(out_socket, 'name') else ''
-                    if 'value' in out_name or 'color' in out_name or 'result' in out_name:
-                        output_socket = out_socket
-                        break
+            if not color_math_input and len(math_node.inputs) > 0:
+                color_math_input = math_node.inputs[0]
+            
+            if not ao_math_input and ao_output and len(math_node.inputs) > 1:
+                ao_math_input = math_node.inputs[1]
+            
+            output_socket = None
+            if color_math_input and ao_math_input:
+                output_socket = _find_socket(_socket_map(math_node.outputs), 'value', 'color', 'result')
                 
                 if not output_socket and len(math_node.outputs) > 0:
                     output_socket = math_node.outputs[0]
-                
-                if output_socket:
-                    node_tree.links.new(output_socket, color_input)
-                    math_node.label += " →Color"
-                    return True
             
-            return False
+            # 5. Raccoglie tutti i collegamenti da creare
+            pending_links = []
+            if color_math_input:
+                pending_links.append((existing_color_link.from_socket, color_math_input))
+            if ao_math_input:
+                pending_links.append((ao_output, ao_math_input))
+            if output_socket:
+                pending_links.append((output_socket, color_input))
+            
+            # 6. Rimuovi il collegamento esistente Color → Disney, poi crea i nuovi in un unico passaggio
+            self.unlink_input(node_tree, color_input)
+            
+            for from_socket, to_socket in pending_links:
+                node_tree.links.new(from_socket, to_socket)
+            
+            # 7. Etichette e Non-Color solo dopo aver creato i collegamenti
+            self.set_non_color(texture_node)
+            
+            ao_suffix = " →Math" if ao_math_input else ""
+            texture_node.label = f"AO: {texture_node.label or texture_node.name}{ao_suffix}"
+            
+            if color_math_input and color_source_node:
+                color_source_node.label = f"{color_source_node.label or color_source_node.name} →Math"
+            
+            math_node.label = "AO Multiply →Color" if output_socket else "AO Multiply"
+            
+            return bool(output_socket)
             
         except Exception as e:
             print(f"Error connecting AO: {e}")
-            import traceback
-            traceback.print_exc()
+            if _DEBUG:
+                import traceback
+                traceback.print_exc()
             return False
     
     def connect_opacity(self, node_tree, texture_node, disney_node):
         """Connect opacity/mask texture to Disney Opacity input"""
-        if 'Opacity' in disney_node.inputs and hasattr(texture_node, 'outputs'):
-            if 'Color' in texture_node.outputs:
-                node_tree.links.new(texture_node.outputs['Color'], disney_node.inputs['Opacity'])
+        disney_input = self._disney_inputs.get('opacity')
+        if disney_input:
+            color_output = self._texture_outputs.get('color')
+            if color_output:
+                node_tree.links.new(color_output, disney_input)
                 texture_node.label = f"OPACITY: {texture_node.label or texture_node.name}"
                 
-                if hasattr(texture_node, 'color_space'):
-                    texture_node.color_space = 'Non-Color'
-                elif hasattr(texture_node, 'gamma'):
-                    texture_node.gamma = 1.0
+                self.set_non_color(texture_node)
                 
                 return True
         return False
@@ -418,26 +508,11 @@ class LUXCORE_OT_connect_selected_texture(Operator):
             return False
         
         try:
-            displacement_node_types = [
-                'LuxCoreNodeShapeHeightDisplacement',
-                'LuxCoreNodeMatHeightDisplacement',
-                'LuxCoreNodeMatDisplacement',
-                'LuxCoreNodeDisplacement',
-                'luxcore_material_height_displacement',
-                'luxcore_material_displacement',
-            ]
-            
-            displacement_node = None
-            for node_type in displacement_node_types:
-                try:
-                    displacement_node = node_tree.nodes.new(type=node_type)
-                    break
-                except:
-                    continue
-            
-            if not displacement_node:
+            if not self._DISPLACEMENT_NODE_TYPE:
                 return False
             
+            displacement_node = node_tree.nodes.new(type=self._DISPLACEMENT_NODE_TYPE)
+            
             displacement_node.location = (disney_node.location.x - 300, texture_node.location.y)
             displacement_node.label = "Height Displacement"
             
@@ -449,33 +524,17 @@ class LUXCORE_OT_connect_selected_texture(Operator):
             if hasattr(displacement_node, 'scale'):
                 displacement_node.scale = 0.02
             
+            smooth_normals = False
             smooth_normals_props = ['normal_smooth', 'smooth_normals', 'smooth_normal', 'normal_smoothing']
             for prop_name in smooth_normals_props:
                 if hasattr(displacement_node, prop_name):
                     try:
                         setattr(displacement_node, prop_name, True)
-                        texture_node.label += " [Smooth]"
+                        smooth_normals = True
                         break
                     except:
                         continue
             
-            if hasattr(texture_node, 'outputs') and 'Color' in texture_node.outputs:
-                height_input = None
-                for inp in displacement_node.inputs:
-                    if 'height' in inp.name.lower():
-                        height_input = inp
-                        break
-                if not height_input and len(displacement_node.inputs) > 0:
-                    height_input = displacement_node.inputs[0]
-                
-                node_tree.links.new(texture_node.outputs['Color'], height_input)
-                texture_node.label = f"HEIGHT: {texture_node.label or texture_node.name}"
-                
-                if hasattr(texture_node, 'color_space'):
-                    texture_node.color_space = 'Non-Color'
-                elif hasattr(texture_node, 'gamma'):
-                    texture_node.gamma = 1.0
-            
             # Crea nodo Subdivision
             subdivision_node = None
             try:
@@ -485,45 +544,59 @@ class LUXCORE_OT_connect_selected_texture(Operator):
             except Exception as e:
                 print(f"Error creating Subdivision node: {str(e)}")
             
-            # Collega Subdivision → Height Displacement (input Shape)
-            if subdivision_node and hasattr(displacement_node, 'inputs'):
-                shape_input_disp = None
-                for inp in displacement_node.inputs:
-                    if inp.name == 'Shape' or 'shape' in inp.name.lower():
-                        shape_input_disp = inp
-                        break
+            # Risolve tutti i socket prima di creare i collegamenti
+            pending_links = []
+            
+            displacement_inputs = _socket_map(displacement_node.inputs)
+            color_output = self._texture_outputs.get('color')
+            if color_output:
+                height_input = _find_socket(displacement_inputs, 'height')
+                if not height_input and len(displacement_node.inputs) > 0:
+                    height_input = displacement_node.inputs[0]
                 
-                if shape_input_disp and hasattr(subdivision_node, 'outputs'):
-                    shape_output_subdiv = None
-                    for out in subdivision_node.outputs:
-                        if out.name == 'Shape' or 'shape' in out.name.lower():
-                            shape_output_subdiv = out
-                            break
+                pending_links.append((color_output, height_input))
+            
+            # Subdivision → Height Displacement (input Shape)
+            if subdivision_node:
+                shape_input_disp = _find_socket(displacement_inputs, 'shape')
+                
+                if shape_input_disp:
+                    shape_output_subdiv = _find_socket(_socket_map(subdivision_node.outputs), 'shape')
                     if not shape_output_subdiv and len(subdivision_node.outputs) > 0:
                         shape_output_subdiv = subdivision_node.outputs[0]
                     
                     if shape_output_subdiv:
-                        node_tree.links.new(shape_output_subdiv, shape_input_disp)
-            
-            if hasattr(displacement_node, 'outputs') and len(displacement_node.outputs) > 0:
-                # Collega Height Displacement → Material Output
-                shape_input = None
-                for inp in material_output.inputs:
-                    if 'shape' in inp.name.lower() or 'displacement' in inp.name.lower():
-                        shape_input = inp
-                        break
+                        pending_links.append((shape_output_subdiv, shape_input_disp))
+            
+            # Height Displacement → Material Output
+            shape_input = None
+            if len(displacement_node.outputs) > 0:
+                shape_input = _find_socket(_socket_map(material_output.inputs), 'shape', 'displacement')
                 
                 if shape_input:
-                    shape_output = None
-                    for out in displacement_node.outputs:
-                        if 'shape' in out.name.lower():
-                            shape_output = out
-                            break
+                    shape_output = _find_socket(_socket_map(displacement_node.outputs), 'shape')
                     if not shape_output and len(displacement_node.outputs) > 0:
                         shape_output = displacement_node.outputs[0]
                     
-                    node_tree.links.new(shape_output, shape_input)
-                    return True
+                    pending_links.append((shape_output, shape_input))
+            
+            for from_socket, to_socket in pending_links:
+                node_tree.links.new(from_socket, to_socket)
+            
+            # Etichette e Non-Color solo dopo aver creato i collegamenti
+            label = texture_node.label or texture_node.name
+            if color_output:
+                label = f"HEIGHT: {label}"
+                self.set_non_color(texture_node)
+            
+            if smooth_normals:
+                label += " [Smooth]"
+            
+            if color_output or smooth_normals:
+                texture_node.label = label
+            
+            if shape_input:
+                return True
             
         except Exception as e:
             print(f"Error connecting height: {e}")
@@ -545,97 +618,98 @@ class LUXCORE_OT_connect_selected_texture(Operator):
             emission_node.label = "Emission"
             
             # Collega la texture al pin Color del nodo Emission
-            if hasattr(texture_node, 'outputs') and 'Color' in texture_node.outputs:
-                if hasattr(emission_node, 'inputs'):
-                    # Cerca il pin Color nel nodo Emission
-                    color_input = None
-                    for input_socket in emission_node.inputs:
-                        if 'color' in input_socket.name.lower():
-                            color_input = input_socket
-                            break
+            color_output = self._texture_outputs.get('color')
+            if color_output:
+                # Cerca il pin Color nel nodo Emission
+                color_input = _find_socket(_socket_map(emission_node.inputs), 'color')
+                
+                if color_input:
+                    node_tree.links.new(color_output, color_input)
+                    texture_node.label = f"EMISSION: {texture_node.label or texture_node.name}"
                     
-                    if color_input:
-                        node_tree.links.new(texture_node.outputs['Color'], color_input)
-                        texture_node.label = f"EMISSION: {texture_node.label or texture_node.name}"
-                        
-                        # Imposta gamma sRGB per emission (è un colore)
-                        if hasattr(texture_node, 'color_space'):
-                            texture_node.color_space = 'sRGB'
-                    else:
-                        self.report({'ERROR'}, "Color input not found in Emission node")
-                        return False
+                    # Imposta gamma sRGB per emission (è un colore)
+                    if self._non_color_attr == 'color_space':
+                        texture_node.color_space = 'sRGB'
+                else:
+                    self.report({'ERROR'}, "Color input not found in Emission node")
+                    return False
             
             # Collega il nodo Emission al pin Emission del Disney node
-            if hasattr(emission_node, 'outputs') and len(emission_node.outputs) > 0:
+            if len(emission_node.outputs) > 0:
                 emission_output = emission_node.outputs[0]
                 
-                # Cerca il pin Emission nel Disney node
-                if 'Emission' in disney_node.inputs:
-                    node_tree.links.new(emission_output, disney_node.inputs['Emission'])
+                # Cerca il pin Emission nel Disney node (anche con nomi alternativi)
+                disney_inputs = self._disney_inputs
+                emission_input = disney_inputs.get('emission') or _find_socket(disney_inputs, 'emission', 'emit')
+                if emission_input:
+                    node_tree.links.new(emission_output, emission_input)
                     return True
                 else:
-                    # Cerca con nomi alternativi
-                    for input_socket in disney_node.inputs:
-                        if 'emission' in input_socket.name.lower() or 'emit' in input_socket.name.lower():
-                            node_tree.links.new(emission_output, input_socket)
-                            return True
-                    
                     self.report({'ERROR'}, "Emission input not found in Disney node")
                     return False
             
         except Exception as e:
             print(f"Error connecting Emission: {e}")
-            import traceback
-            traceback.print_exc()
+            if _DEBUG:
+                import traceback
+                traceback.print_exc()
         
         return False
     
     def connect_orm(self, node_tree, texture_node, disney_node):
         """Collega texture ORM: R=Occlusione, G=Roughness, B=Metallic - Con AO moltiplicato alla Color"""
+        if not self._HAS_SPLIT3:
+            print("ERROR: Cannot create split node")
+            return False
+        
+        # Verifica i socket prima di creare nodi, per non lasciare nodi orfani
+        disney_inputs = self._disney_inputs
+        color_output = self._texture_outputs.get('color')
+        roughness_input = disney_inputs.get('roughness')
+        metallic_input = disney_inputs.get('metallic')
+        if not color_output or not (roughness_input or metallic_input):
+            return False
+        
         try:
             # Crea nodo Split RGB
-            split_node = node_tree.nodes.new(type="LuxCoreNodeTexSplitFloat3")
-            split_node.location = (disney_node.location.x - 400, texture_node.location.y)
+            split_node = node_tree.nodes.new(type=_SPLIT3_NODE_TYPE)
+            disney_x = disney_node.location.x
+            texture_y = texture_node.location.y
+            split_node.location = (disney_x - 400, texture_y)
             split_node.label = "Split ORM"
             
-            # Collega la texture ORM al nodo split
-            if hasattr(texture_node, 'outputs') and 'Color' in texture_node.outputs:
-                node_tree.links.new(texture_node.outputs['Color'], split_node.inputs[0])
-                texture_node.label = f"ORM: {texture_node.label or texture_node.name}"
-                
-                # Imposta come non-colore
-                if hasattr(texture_node, 'color_space'):
-                    texture_node.color_space = 'Non-Color'
-                elif hasattr(texture_node, 'gamma'):
-                    texture_node.gamma = 1.0
-            
-            # Collega Roughness (canale G)
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 1:
-                roughness_output = split_node.outputs[1]
-                if 'Roughness' in disney_node.inputs:
-                    node_tree.links.new(roughness_output, disney_node.inputs['Roughness'])
-            
-            # Collega Metallic (canale B)
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 2:
-                metallic_output = split_node.outputs[2]
-                if 'Metallic' in disney_node.inputs:
-                    node_tree.links.new(metallic_output, disney_node.inputs['Metallic'])
+            # Raccoglie i collegamenti e li crea tutti insieme, a partire da texture ORM → split
+            pending_links = [(color_output, split_node.inputs[0])]
+            
+            # Canali R = Occlusion, G = Roughness, B = Metallic
+            ao_output = None
+            split_outputs = split_node.outputs
+            if len(split_outputs) >= 3:
+                ao_output = split_outputs[0]
+                if roughness_input:
+                    pending_links.append((split_outputs[1], roughness_input))
+                if metallic_input:
+                    pending_links.append((split_outputs[2], metallic_input))
+            
+            for from_socket, to_socket in pending_links:
+                node_tree.links.new(from_socket, to_socket)
+            
+            current_label = texture_node.label or texture_node.name
+            if not current_label.startswith("ORM:"):
+                texture_node.label = f"ORM: {current_label}"
             
             # Gestisce Occlusion (canale R) moltiplicato con Color texture
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 0:
-                ao_output = split_node.outputs[0]  # Channel R
-                
-                # Cerca una texture Color esistente nel node tree
-                color_node = None
-                for node in node_tree.nodes:
-                    if hasattr(node, 'label') and 'COLOR' in node.label.upper():
-                        color_node = node
-                        break
+            if ao_output:
+                # Texture Color esistente, trovata durante l'indicizzazione in execute()
+                color_node = self._tag_index.get('COLOR')
                 
                 # Se esiste una Color texture, moltiplica AO con Color
                 if color_node:
                     self.multiply_ao_with_color(node_tree, disney_node, color_node, ao_output, texture_node)
             
+            # Imposta come non-colore, dopo aver creato tutti i collegamenti
+            self.set_non_color(texture_node)
+            
             return True
             
         except Exception as e:
@@ -645,50 +719,59 @@ class LUXCORE_OT_connect_selected_texture(Operator):
     
     def connect_ors(self, node_tree, texture_node, disney_node):
         """Collega texture ORS: R=Occlusione, G=Roughness, B=Specular - Con AO moltiplicato alla Color"""
+        if not self._HAS_SPLIT3:
+            print("ERROR: Cannot create split node")
+            return False
+        
+        # Verifica i socket prima di creare nodi, per non lasciare nodi orfani
+        disney_inputs = self._disney_inputs
+        color_output = self._texture_outputs.get('color')
+        roughness_input = disney_inputs.get('roughness')
+        specular_input = disney_inputs.get('specular')
+        if not color_output or not (roughness_input or specular_input):
+            return False
+        
         try:
             # Crea nodo Split RGB
-            split_node = node_tree.nodes.new(type="LuxCoreNodeTexSplitFloat3")
-            split_node.location = (disney_node.location.x - 400, texture_node.location.y)
+            split_node = node_tree.nodes.new(type=_SPLIT3_NODE_TYPE)
+            disney_x = disney_node.location.x
+            texture_y = texture_node.location.y
+            split_node.location = (disney_x - 400, texture_y)
             split_node.label = "Split ORS"
             
-            # Collega la texture ORS al nodo split
-            if hasattr(texture_node, 'outputs') and 'Color' in texture_node.outputs:
-                node_tree.links.new(texture_node.outputs['Color'], split_node.inputs[0])
-                texture_node.label = f"ORS: {texture_node.label or texture_node.name}"
-                
-                # Imposta come non-colore
-                if hasattr(texture_node, 'color_space'):
-                    texture_node.color_space = 'Non-Color'
-                elif hasattr(texture_node, 'gamma'):
-                    texture_node.gamma = 1.0
-            
-            # Collega Roughness (canale G)
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 1:
-                roughness_output = split_node.outputs[1]
-                if 'Roughness' in disney_node.inputs:
-                    node_tree.links.new(roughness_output, disney_node.inputs['Roughness'])
-            
-            # Collega Specular (canale B)
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 2:
-                specular_output = split_node.outputs[2]
-                if 'Specular' in disney_node.inputs:
-                    node_tree.links.new(specular_output, disney_node.inputs['Specular'])
+            # Raccoglie i collegamenti e li crea tutti insieme, a partire da texture ORS → split
+            pending_links = [(color_output, split_node.inputs[0])]
+            
+            # Canali R = Occlusion, G = Roughness, B = Specular
+            # (con il Disney LuxCore standard il controllo del numero di canali non serve)
+            ao_output = None
+            split_outputs = split_node.outputs
+            if disney_node.bl_idname == 'LuxCoreNodeMatDisney' or len(split_outputs) >= 3:
+                ao_output = split_outputs[0]
+                if roughness_input:
+                    pending_links.append((split_outputs[1], roughness_input))
+                if specular_input:
+                    pending_links.append((split_outputs[2], specular_input))
+            
+            for from_socket, to_socket in pending_links:
+                node_tree.links.new(from_socket, to_socket)
+            
+            current_label = texture_node.label or texture_node.name
+            if not current_label.startswith("ORS:"):
+                texture_node.label = f"ORS: {current_label}"
             
             # Gestisce Occlusion (canale R) moltiplicato con Color texture
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 0:
-                ao_output = split_node.outputs[0]  # Channel R
-                
-                # Cerca una texture Color esistente nel node tree
-                color_node = None
-                for node in node_tree.nodes:
-                    if hasattr(node, 'label') and 'COLOR' in node.label.upper():
-                        color_node = node
-                        break
+            if ao_output:
+                # Texture Color esistente, trovata durante l'indicizzazione in execute()
+                color_node = self._tag_index.get('COLOR')
                 
                 # Se esiste una Color texture, moltiplica AO con Color
                 if color_node:
                     self.multiply_ao_with_color(node_tree, disney_node, color_node, ao_output, texture_node)
             
+            # Imposta come non-colore, dopo aver creato tutti i collegamenti
+            self.set_non_color(texture_node)
+            
             return True
             
         except Exception as e:
@@ -696,185 +779,168 @@ class LUXCORE_OT_connect_selected_texture(Operator):
         
         return False
     
-    
     def multiply_ao_with_color(self, node_tree, material_node, color_node, ao_channel, ao_source_node=None):
         """Multiply AO channel with Color and connect to Base Color"""
         try:
             # Create a Math node for multiplication (or ColorMix in scale mode)
-            multiply_node_types = [
-                'LuxCoreNodeTexMath',
-                'LuxCoreNodeMath',
-                'LuxCoreNodeTexMix',
-                'LuxCoreNodeTexMixColor',
-                'luxcore_tex_math',
-                'luxcore_tex_mix',
-            ]
-            
-            multiply_node = None
-            for node_type in multiply_node_types:
-                try:
-                    multiply_node = node_tree.nodes.new(type=node_type)
-                    break
-                except:
-                    continue
-            
-            if not multiply_node:
+            if not self._MATH_NODE_TYPE:
                 print("ERROR: Cannot create multiply node")
                 return False
             
-            multiply_node.location = (material_node.location.x - 300, 
-                                     color_node.location.y if color_node else material_node.location.y)
+            multiply_node = node_tree.nodes.new(type=self._MATH_NODE_TYPE)
+            
+            mx, my = material_node.location
+            multiply_x = mx - 300
+            multiply_y = color_node.location.y if color_node else my
+            multiply_node.location = (multiply_x, multiply_y)
             multiply_node.label = "AO Multiply"
             
             # Set operation to Multiply if available
-            if hasattr(multiply_node, 'operation'):
+            if getattr(multiply_node, 'operation', _MISSING) is not _MISSING:
                 multiply_node.operation = 'MULTIPLY'
-            elif hasattr(multiply_node, 'mode'):
+            elif getattr(multiply_node, 'mode', _MISSING) is not _MISSING:
                 multiply_node.mode = 'scale'
             
             # Get color output from color node
-            color_output = None
-            if color_node and hasattr(color_node, 'outputs') and len(color_node.outputs) > 0:
-                for output in color_node.outputs:
-                    if output.name.lower() in ['color', 'image', 'value']:
-                        color_output = output
-                        break
-                if not color_output and len(color_node.outputs) > 0:
-                    color_output = color_node.outputs[0]
-            
-            # If no color texture, create a white constant
-            if not color_output:
-                white_node = node_tree.nodes.new(type='LuxCoreNodeTexConstantFloat3')
-                white_node.location = (multiply_node.location.x - 200, multiply_node.location.y)
-                white_node.value = (1.0, 1.0, 1.0)
-                white_node.label = "White"
+            color_output = _pick_output(color_node.outputs) if color_node else None
+            
+            # If no color texture, reuse the tree's white constant or create one
+            if not color_output and self._HAS_CONST3:
+                white_node = self._tag_index.get('WHITE')
+                if white_node is None or white_node.bl_idname != _CONST3_NODE_TYPE:
+                    white_node = node_tree.nodes.new(type=_CONST3_NODE_TYPE)
+                    white_node.location = (multiply_x - 200, multiply_y)
+                    white_node.value = (1.0, 1.0, 1.0)
+                    white_node.label = "White"
+                    self._tag_index['WHITE'] = white_node
                 color_output = white_node.outputs[0] if len(white_node.outputs) > 0 else None
             
-            # Connect color to first input of multiply node
-            if color_output:
-                if len(multiply_node.inputs) > 0:
-                    node_tree.links.new(color_output, multiply_node.inputs[0])
-                    print(f"DEBUG: Color connected to multiply node")
-            
-            # Connect AO channel to second input of multiply node
-            if ao_channel and len(multiply_node.inputs) > 1:
-                node_tree.links.new(ao_channel, multiply_node.inputs[1])
-                print(f"DEBUG: AO channel connected to multiply node")
-                if ao_source_node:
-                    ao_source_node.label = f"AO: {ao_source_node.label or ao_source_node.name}"
-            
-            # Connect multiply output to Base Color
-            if len(multiply_node.outputs) > 0 and 'Base Color' in material_node.inputs:
-                multiply_output = None
-                for output in multiply_node.outputs:
-                    if output.name.lower() in ['color', 'value', 'result']:
-                        multiply_output = output
-                        break
-                if not multiply_output and len(multiply_node.outputs) > 0:
-                    multiply_output = multiply_node.outputs[0]
+            # Resolve every connection first, then create the links in one pass
+            multiply_inputs = multiply_node.inputs
+            pending_links = []
+            
+            # Color to first input of multiply node
+            color_linked = bool(color_output) and len(multiply_inputs) > 0
+            if color_linked:
+                pending_links.append((color_output, multiply_inputs[0]))
+            
+            # AO channel to second input of multiply node
+            ao_linked = bool(ao_channel) and len(multiply_inputs) > 1
+            if ao_linked:
+                pending_links.append((ao_channel, multiply_inputs[1]))
+            
+            # Multiply output to Base Color
+            multiply_output = None
+            base_color_input = material_node.inputs.get('Base Color')
+            if base_color_input:
+                multiply_output = _pick_output(multiply_node.outputs)
                 
                 if multiply_output:
                     # Remove existing connection to Base Color if any
-                    base_color_input = material_node.inputs['Base Color']
-                    for link in node_tree.links:
-                        if link.to_socket == base_color_input:
-                            node_tree.links.remove(link)
-                            break
-                    
-                    node_tree.links.new(multiply_output, base_color_input)
-                    print(f"DEBUG: Multiply output connected to Base Color")
-                    return True
+                    self.unlink_input(node_tree, base_color_input)
+                    pending_links.append((multiply_output, base_color_input))
+            
+            for from_socket, to_socket in pending_links:
+                node_tree.links.new(from_socket, to_socket)
+            
+            if _DEBUG:
+                if color_linked:
+                    print("DEBUG: Color connected to multiply node")
+                if ao_linked:
+                    print("DEBUG: AO channel connected to multiply node")
+                if multiply_output:
+                    print("DEBUG: Multiply output connected to Base Color")
+            
+            if ao_linked and ao_source_node:
+                current_label = ao_source_node.label or ao_source_node.name
+                if not current_label.startswith("AO:"):
+                    ao_source_node.label = f"AO: {current_label}"
+            if multiply_output:
+                return True
             
         except Exception as e:
             print(f"ERROR in multiply_ao_with_color: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            if _DEBUG:
+                import traceback
+                traceback.print_exc()
         
         return False
     
     def activate_normal_map(self, texture_node, normal_strength):
         try:
-            normalmap_props = [
-                'normalmap', 'normal_map', 'use_normalmap', 'use_normal_map',
-                'is_normalmap', 'is_normal_map', 'normal', 'as_normal',
-                'use_as_normalmap'
-            ]
-            
-            for prop_name in normalmap_props:
-                if hasattr(texture_node, prop_name):
-                    try:
-                        setattr(texture_node, prop_name, True)
-                        break
-                    except:
-                        continue
+            normal_map_prop, strength_prop = _normal_map_setters(type(texture_node))
             
-            bump_props = [
-                'bump_height', 'height', 'strength', 'normal_strength',
-                'normal_scale', 'scale', 'value', 'intensity'
-            ]
-            for prop_name in bump_props:
-                if hasattr(texture_node, prop_name):
-                    try:
-                        setattr(texture_node, prop_name, normal_strength)
-                        break
-                    except:
-                        continue
-                        
+            if normal_map_prop:
+                setattr(texture_node, normal_map_prop, True)
+            
+            if strength_prop:
+                setattr(texture_node, strength_prop, normal_strength)
+        
         except Exception as e:
             print(f"Error activating normal map: {e}")
+    
+    # texture_type -> (connect method, names of the extra arguments it takes)
+    _DISPATCH = {
+        'COLOR': (connect_color, ()),
+        'ROUGHNESS': (connect_roughness, ()),
+        'NORMAL': (connect_normal, ('normal_strength',)),
+        'BUMP': (connect_bump, ()),
+        'SPECULAR': (connect_specular, ()),
+        'METALLIC': (connect_metallic, ()),
+        'OCCLUSION': (connect_occlusion, ()),
+        'HEIGHT': (connect_height, ('material_output', 'displacement_height')),
+        'OPACITY': (connect_opacity, ()),
+        'EMISSION': (connect_emission, ()),
+        'ORM': (connect_orm, ()),
+        'ORS': (connect_ors, ()),
+    }
+
+# (texture_type, label, icon) entries of the Connect Texture menu
+_MENU_ENTRIES = (
+    ('COLOR', "Color", 'MATERIAL'),
+    ('ROUGHNESS', "Roughness", 'NODE_TEXTURE'),
+    ('NORMAL', "Normal", 'NORMALS_FACE'),
+    ('BUMP', "Bump", 'MOD_SMOOTH'),
+    ('SPECULAR', "Specular", 'SHADING_SOLID'),
+    ('METALLIC', "Metallic", 'SHADING_WIRE'),
+    ('OCCLUSION', "Occlusion", 'LIGHT_HEMI'),
+    ('HEIGHT', "Height", 'MOD_DISPLACE'),
+    ('OPACITY', "Opacity/Mask", 'IMAGE_ALPHA'),
+    ('EMISSION', "Emission", 'LIGHT'),
+    ('ORM', "ORM", 'NODE_TEXTURE'),
+    ('ORS', "ORS", 'NODE_TEXTURE'),
+)
 
 class NODE_MT_luxcore_connect_selected_menu(Menu):
     bl_label = "Connect Texture"
     bl_idname = "NODE_MT_luxcore_connect_selected_menu"
     
     def draw(self, context):
-        layout = self.layout
-        
-        types = [
-            ('COLOR', "Color", 'MATERIAL'),
-            ('ROUGHNESS', "Roughness", 'NODE_TEXTURE'),
-            ('NORMAL', "Normal", 'NORMALS_FACE'),
-            ('BUMP', "Bump", 'MOD_SMOOTH'),
-            ('SPECULAR', "Specular", 'SHADING_SOLID'),
-            ('METALLIC', "Metallic", 'SHADING_WIRE'),
-            ('OCCLUSION', "Occlusion", 'LIGHT_HEMI'),
-            ('HEIGHT', "Height", 'MOD_DISPLACE'),
-            ('OPACITY', "Opacity/Mask", 'IMAGE_ALPHA'),
-            ('EMISSION', "Emission", 'LIGHT'),
-            ('ORM', "ORM", 'NODE_TEXTURE'),
-            ('ORS', "ORS", 'NODE_TEXTURE'),
-        ]
+        layout_operator = self.layout.operator
+        op_idname = LUXCORE_OT_connect_selected_texture.bl_idname
         
-        for type_id, label, icon in types:
-            op = layout.operator(
-                LUXCORE_OT_connect_selected_texture.bl_idname,
-                text=label,
-                icon=icon
-            )
-            op.texture_type = type_id
+        for type_id, label, icon in _MENU_ENTRIES:
+            layout_operator(op_idname, text=label, icon=icon).texture_type = type_id
 
 def draw_luxcore_connect_selected_menu(self, context):
-    if not context.space_data or not context.space_data.node_tree:
+    space = context.space_data
+    if not space:
         return
     
-    node_tree = context.space_data.node_tree
-    active_node = node_tree.nodes.active
-    
-    if not active_node:
+    node_tree = space.node_tree
+    if not node_tree:
         return
     
-    texture_node_types = [
-        'LuxCoreNodeTexImagemap',
-        'LuxCoreNodeTexImage',
-        'ShaderNodeTexImage'
-    ]
+    active_node = node_tree.nodes.active
+    if active_node is None or active_node.bl_idname not in _TEXTURE_NODE_TYPES:
+        return
     
-    if active_node.bl_idname in texture_node_types:
-        layout = self.layout
-        layout.separator()
-        layout.menu("NODE_MT_luxcore_connect_selected_menu")
+    layout = self.layout
+    layout.separator()
+    layout.menu("NODE_MT_luxcore_connect_selected_menu")
 
 def register():
+    LUXCORE_OT_connect_selected_texture.resolve_node_types()
     bpy.utils.register_class(LUXCORE_OT_connect_selected_texture)
     bpy.utils.register_class(NODE_MT_luxcore_connect_selected_menu)
     
@@ -12,10 +12,400 @@ bl_info = {
 import bpy
 import os
 import re
+from collections import namedtuple
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 from bpy.props import CollectionProperty, StringProperty, BoolProperty, EnumProperty
 from bpy_extras.io_utils import ImportHelper
 from bpy.types import Operator, Panel, Menu
 
+# Print debug messages while textures are recognized and loaded, and full tracebacks for errors
+_DEBUG = False
+
+# Texture mapping with priority
+_TEXTURE_MAPPING = MappingProxyType({
+    'orm': {
+        'keywords': ('orm', 'arm', 'mro',
+                   'metallicroughness', 'roughnessmetallic',
+                   'occlusionroughnessmetallic', 'ambientroughnessmetallic'),
+        'socket': None,
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'is_orm': True,
+        'priority': 100
+    },
+    'ors': {
+        'keywords': ('ors', 'occlusionroughnessspecular', 'roughnessspecularocclusion',
+                   'specularroughnessocclusion', 'ambientroughnessspecular',
+                   'occlusionroughnessgloss', 'roughnessglossocclusion'),
+        'socket': None,
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'is_ors': True,
+        'priority': 90
+    },
+    'color': {
+        'keywords': ('color', 'diff', 'diffuse', 'albedo', 'basecolor', 'col', 'base', 
+                   'basecol', 'diffuse', 'dif', 'dff', 'clr', 'colour'),
+        'socket': 'Base Color',
+        'color_space': 'sRGB',
+        'is_color': True,
+        'is_color_map': True,
+        'priority': 80
+    },
+    'emission': {
+        'keywords': ('emission', 'emit', 'emissive', 'emiss', 'glow', 'light'),
+        'socket': 'Emission',
+        'color_space': 'sRGB',
+        'is_color': True,
+        'is_emission': True,
+        'priority': 75
+    },
+    'normal': {
+        'keywords': ('normal', 'norm', 'nrm', 'nor', 'normalmap', 'normal_map', 
+                   'normalgl', 'normal_dx', 'normaldx', 'nrml', 'normals',
+                   'normal_gl', 'norm_gl'),
+        'socket': 'Bump',
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'is_normal': True,
+        'priority': 70
+    },
+    'bump': {
+        'keywords': ('bump', 'bmp', 'bump_map', 'bumpmap'),
+        'socket': 'Bump',
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'is_bump': True,
+        'priority': 65
+    },
+    'metallic': {
+        'keywords': ('metal', 'metallic', 'metallness', 'metalness', 'mtl', 'met', 'metalic'),
+        'socket': 'Metallic',
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'priority': 60
+    },
+    'roughness': {
+        'keywords': ('rough', 'roughness', 'rugosità', 'roughness', 'gloss', 'glossiness',
+                   'rgh', 'roughness', 'rghns', 'rough', 'rug'),
+        'socket': 'Roughness',
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'priority': 50
+    },
+    'specular': {
+        'keywords': ('spec', 'specular', 'specularity', 'spc', 'specular', 'specularlevel'),
+        'socket': 'Specular',
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'priority': 40
+    },
+    'height': {
+        'keywords': ('height', 'disp', 'displacement', 'heightmap', 'height_map',
+                   'hgt', 'displace', 'depth', 'depthmap'),
+        'socket': 'Height',
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'is_height': True,
+        'priority': 30
+    },
+    'opacity': {
+        'keywords': ('opacity', 'alpha', 'transparency', 'transparent', 'opac',
+                   'alph', 'trans', 'op', 'mask'),
+        'socket': 'Opacity',
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'priority': 20
+    },
+    'ao': {
+        'keywords': ('ao', 'ambientocclusion', 'occlusion', 'ambient', 'ambient_occlusion',
+                   'occl', 'ambocc', 'ambientoccl', 'occlusion'),
+        'socket': None,
+        'color_space': 'Non-Color',
+        'is_color': False,
+        'is_ao': True,
+        'priority': 10
+    }
+})
+
+_DISNEY_NODE_TYPES = frozenset((
+    'LuxCoreNodeMatDisney',
+    'LuxCoreNodeMatDisney2',
+    'luxcore_material_disney',
+))
+
+# Try different names for 2D Mapping node in LuxCore
+_MAPPING_NODE_TYPES = (
+    'LuxCoreNodeTexMapping2D',
+    'LuxCoreNodeMapping2D',
+    'luxcore_tex_mapping2d',
+    'LuxCoreNodeUV',
+)
+
+# List of possible names for displacement node
+_DISPLACEMENT_NODE_TYPES = (
+    'LuxCoreNodeShapeHeightDisplacement',
+    'LuxCoreNodeMatHeightDisplacement',
+    'LuxCoreNodeMatDisplacement',
+    'LuxCoreNodeDisplacement',
+    'luxcore_material_height_displacement',
+    'luxcore_material_displacement',
+)
+
+_BUMP_NODE_TYPES = ('LuxCoreNodeTexBump',)
+_SUBDIVISION_NODE_TYPES = ('LuxCoreNodeShapeSubdiv',)
+_EMISSION_NODE_TYPES = ('LuxCoreNodeMatEmission',)
+_SPLIT_NODE_TYPES = ('LuxCoreNodeTexSplitFloat3',)
+
+# Fixed values
+_NORMAL_STRENGTH = 1.0
+_DISPLACEMENT_HEIGHT = 0.01
+
+# Candidate property names, resolved once per node class by _resolve_prop()
+_NORMAL_STRENGTH_PROPS = ('bump_height', 'height', 'strength', 'normal_strength')
+_DISPLACEMENT_HEIGHT_PROPS = ('height', 'value', 'strength', 'displacement_height')
+_DISPLACEMENT_SCALE_PROPS = ('scale', 'Scale', 'scaling', 'factor', 'multiplier', 'height_scale')
+_SMOOTH_NORMALS_PROPS = ('normal_smooth', 'smooth_normals', 'smooth_normal', 'normal_smoothing')
+
+# In LuxCore, we might use a Math node to multiply textures
+_MIX_NODE_TYPES = (
+    'LuxCoreNodeTexMath',  # Most likely
+    'LuxCoreNodeMath',
+    'LuxCoreNodeTexMix',
+    'LuxCoreNodeTexMixColor',
+    'luxcore_tex_math',
+    'luxcore_tex_mix',
+)
+
+# Input names (lowercase, without spaces) of the mix node for color and AO
+_FIRST_INPUT_KEYS = ('value1', 'input1', 'color1', 'a')
+_SECOND_INPUT_KEYS = ('value2', 'input2', 'color2', 'b')
+
+# force_type enum value -> texture mapping key
+_FORCE_TYPE_MAP = MappingProxyType({
+    'COLOR': 'color',
+    'NORMAL': 'normal',
+    'ROUGHNESS': 'roughness',
+    'METALLIC': 'metallic',
+    'SPECULAR': 'specular',
+    'DISPLACEMENT': 'height',
+    'AO': 'ao',
+    'ORM': 'orm',
+    'ORS': 'ors',
+})
+
+# Socket names tried, in order, to chain height texture -> displacement node -> Material Output
+_DISPLACEMENT_INPUT_NAMES = ('Height', 'height', 'Displacement', 'displacement', 'Texture', 'texture', 'Input')
+_DISPLACEMENT_OUTPUT_NAMES = ('Displacement', 'displacement', 'Height', 'height', 'Vector', 'vector')
+_OUTPUT_DISPLACEMENT_INPUT_NAMES = ('Displacement', 'displacement', 'Shape', 'shape')
+
+# Label suffixes shared by several connection paths
+_LBL_MATH = " →Math"
+_LBL_BASE_COLOR = " →Base Color"
+_LBL_NO_OUTPUT = " [No Output]"
+
+# Single-channel types that an ORM or ORS texture already covers
+_PACKED_CHANNEL_TYPES = frozenset(('metallic', 'roughness', 'ao', 'specular'))
+
+# Mapping input names in the texture and output names in the mapping node
+_MAPPING_INPUT_NAMES = ('2D Mapping', 'Mapping', 'UV', 'UV Map', 'UVs', 'Vector')
+_MAPPING_OUTPUT_NAMES = ('2D Mapping', 'Mapping', 'UV', 'Vector', 'Output')
+
+# Keyword trie built once: every node maps a character to its child node, and the
+# _TRIE_END key holds the rank (mapping order, i.e. descending priority) of the
+# first texture type using the keyword that ends there
+_TRIE_END = None
+
+def _build_keyword_trie(texture_mapping):
+    """Build the keyword trie for all texture types"""
+    trie = {}
+    for rank, type_info in enumerate(texture_mapping.values()):
+        for keyword in type_info['keywords']:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node.setdefault(_TRIE_END, rank)
+    return trie
+
+_TYPE_KEYS = tuple(_TEXTURE_MAPPING)
+_KEYWORD_TRIE = _build_keyword_trie(_TEXTURE_MAPPING)
+
+# Keyword sets for the token match; every keyword containing "_" starts with
+# another keyword of the same type, so whole tokens are enough
+_KEYWORD_SETS = MappingProxyType({
+    type_key: frozenset(type_info['keywords'])
+    for type_key, type_info in _TEXTURE_MAPPING.items()
+})
+
+_TOKEN_SEPARATORS = re.compile(r'[_-]+')
+
+@lru_cache(maxsize=None)
+def _strict_classify(filename_no_ext):
+    """Highest priority type with a keyword delimited by start/end or _ -"""
+    tokens = set(_TOKEN_SEPARATORS.split(filename_no_ext))
+    for type_key, keyword_set in _KEYWORD_SETS.items():
+        if not tokens.isdisjoint(keyword_set):
+            return type_key
+    return None
+
+@lru_cache(maxsize=None)
+def _loose_classify(filename_no_ext):
+    """Highest priority type with a keyword anywhere in the filename"""
+    # Single pass over the filename through the keyword trie
+    length = len(filename_no_ext)
+    best_rank = None
+    for start in range(length):
+        node = _KEYWORD_TRIE
+        for end in range(start, length):
+            node = node.get(filename_no_ext[end])
+            if node is None:
+                break
+            rank = node.get(_TRIE_END)
+            if rank is not None and (best_rank is None or rank < best_rank):
+                best_rank = rank
+    
+    return _TYPE_KEYS[best_rank] if best_rank is not None else None
+
+def _classify(filename_no_ext, loose_match=True):
+    """Return the texture type key for a lowercase filename without extension, or None"""
+    return (_strict_classify(filename_no_ext)
+            or (_loose_classify(filename_no_ext) if loose_match else None))
+
+# Selected file: full path, file name, stem as displayed and lowercase stem for recognition
+_FileRec = namedtuple('_FileRec', 'path name stem lower')
+
+def _file_rec(path, name):
+    """Build the file record, deriving both stems once"""
+    stem = os.path.splitext(name)[0]
+    return _FileRec(path, name, stem, stem.lower())
+
+# Loaded texture: texture type, file name and image node
+_LoadedTex = namedtuple('_LoadedTex', 'type name node')
+
+@lru_cache(maxsize=None)
+def _resolve_prop(cls, candidates):
+    """Return the first candidate that is an RNA property of the node class, or None"""
+    properties = cls.bl_rna.properties.keys()
+    for prop_name in candidates:
+        if prop_name in properties:
+            return prop_name
+    return None
+
+def _index_sockets(sockets):
+    """Map exact and lowercase socket names to sockets (first socket wins on duplicates)"""
+    by_name = {}
+    by_lower_name = {}
+    for socket in sockets:
+        by_name.setdefault(socket.name, socket)
+        by_lower_name.setdefault(socket.name.lower(), socket)
+    return by_name, by_lower_name
+
+def _find_socket(by_name, by_lower_name, name, *keywords):
+    """Socket with the exact name, else the first whose lowercase name contains one of keywords"""
+    socket = by_name.get(name)
+    if socket is None:
+        socket = next((socket for socket_name, socket in by_lower_name.items()
+                       if any(keyword in socket_name for keyword in keywords)), None)
+    return socket
+
+# Property names that turn on the normal map option of an image node
+_NORMALMAP_PROPS = ('normalmap', 'normal_map', 'use_normalmap', 'use_normal_map', 'is_normalmap', 'normal', 'as_normal')
+
+# Normal map properties per node class: (known names found, other boolean 'normal' properties)
+_NORMALMAP_PROP_CACHE = {}
+
+def _normalmap_props(cls):
+    """Return the cached normal map property names of the node class"""
+    props = _NORMALMAP_PROP_CACHE.get(cls)
+    if props is None:
+        rna_props = cls.bl_rna.properties
+        known = tuple(prop_name for prop_name in _NORMALMAP_PROPS if prop_name in rna_props)
+        booleans = tuple(prop.identifier for prop in rna_props
+                         if prop.type == 'BOOLEAN' and 'normal' in prop.identifier.lower())
+        props = _NORMALMAP_PROP_CACHE[cls] = (known, booleans)
+    return props
+
+# Working bl_idname found for each kind of node, kept for the whole Blender session
+_RESOLVED = {}
+
+def _is_luxcore_displacement(cls_name):
+    """Fallback filter for displacement node classes"""
+    cls_name_lower = cls_name.lower()
+    return 'LuxCore' in cls_name and ('displacement' in cls_name_lower or 'height' in cls_name_lower)
+
+@lru_cache(maxsize=None)
+def _available_node_types():
+    """Registered node class names (and bl_idnames), in discovery order, collected once"""
+    available = {}
+    pending = list(bpy.types.Node.__subclasses__())
+    for cls in pending:
+        cls_name = cls.__name__
+        if cls_name in available:
+            continue
+        available[cls_name] = cls
+        bl_idname = getattr(cls, 'bl_idname', None)
+        if isinstance(bl_idname, str):
+            available.setdefault(bl_idname, cls)
+        pending.extend(cls.__subclasses__())
+    return available
+
+def _resolve_node_type(key, candidates, fallback_filter=None):
+    """Find the first registered bl_idname among candidates without creating nodes, caching it under key"""
+    available = _available_node_types()
+    for node_type in candidates:
+        if node_type in available:
+            _RESOLVED[key] = node_type
+            return node_type
+    
+    # If not found, try to search all registered node classes
+    if fallback_filter:
+        for cls_name in available:
+            if fallback_filter(cls_name):
+                _RESOLVED[key] = cls_name
+                return cls_name
+    
+    # Nothing found: collect the classes again next time, other add-ons may register later
+    _available_node_types.cache_clear()
+    return None
+
+def _new_node(node_tree, key, candidates, fallback_filter=None):
+    """Create a node of the first working type among candidates, resolved once per session"""
+    failed_type = _RESOLVED.get(key) or _resolve_node_type(key, candidates, fallback_filter)
+    if failed_type:
+        try:
+            return node_tree.nodes.new(type=failed_type)
+        except:
+            # The type does not work here: forget it and collect the classes again
+            _RESOLVED.pop(key, None)
+            _available_node_types.cache_clear()
+    
+    # Probe the candidates directly
+    for node_type in candidates:
+        if node_type == failed_type:
+            continue
+        try:
+            node = node_tree.nodes.new(type=node_type)
+        except:
+            continue
+        _RESOLVED[key] = node_type
+        return node
+    
+    # Then every registered class accepted by the fallback filter
+    if fallback_filter:
+        for cls_name in _available_node_types():
+            if cls_name == failed_type or not fallback_filter(cls_name):
+                continue
+            try:
+                node = node_tree.nodes.new(type=cls_name)
+            except:
+                continue
+            _RESOLVED[key] = cls_name
+            return node
+    
+    return None
+
 class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
     """Select PBR textures to connect automatically"""
     bl_idname = "luxcore.select_pbr_textures"
@@ -41,6 +431,26 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
         default=True,
     )
     
+    loose_match: BoolProperty(
+        name="Match Inside Words",
+        description="When no delimited keyword is found, also recognize keywords inside longer words",
+        default=True,
+    )
+    
+    # Connection method for each texture type, most common first; None for the types connected
+    # after all textures are loaded, the others are linked straight to their socket.
+    # Handlers add to the label parts of the texture and return False to drop the texture
+    _TEX_HANDLERS = {
+        'color': None,
+        'normal': '_connect_normal',
+        'ao': None,
+        'orm': None,
+        'ors': None,
+        'bump': '_connect_bump',
+        'height': '_connect_height',
+        'emission': '_connect_emission',
+    }
+    
     force_type: EnumProperty(
         name="Force Texture Type",
         items=[
@@ -70,164 +480,56 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
         
         node_tree = space.node_tree
         disney_node = node_tree.nodes.active
+        auto_connect = self.auto_connect
         
-        # Find LuxCore Material Output node
-        material_output = None
+        # Index the existing nodes by bl_idname and type in a single pass (first node wins)
+        nodes_by_idname = {}
+        nodes_by_type = {}
         for node in node_tree.nodes:
-            if node.bl_idname == 'LuxCoreNodeMatOutput':
-                material_output = node
-                break
+            nodes_by_idname.setdefault(node.bl_idname, node)
+            nodes_by_type.setdefault(node.type, node)
         
-        # If not found, also search standard type as fallback
-        if not material_output:
-            for node in node_tree.nodes:
-                if node.type == 'OUTPUT_MATERIAL':
-                    material_output = node
-                    break
+        # Find LuxCore Material Output node, standard type as fallback
+        material_output = nodes_by_idname.get('LuxCoreNodeMatOutput') or nodes_by_type.get('OUTPUT_MATERIAL')
         
-        disney_node_types = [
-            'LuxCoreNodeMatDisney',
-            'LuxCoreNodeMatDisney2',
-            'luxcore_material_disney'
-        ]
-        
-        if not disney_node or disney_node.bl_idname not in disney_node_types:
+        if not disney_node or disney_node.bl_idname not in _DISNEY_NODE_TYPES:
             self.report({'ERROR'}, "Select a LuxCore Disney node!")
             return {'CANCELLED'}
         
-        # Fixed values
-        normal_strength = 1.0
-        displacement_height = 0.01
+        # Index Disney inputs by exact and lowercase name
+        disney_in, disney_in_lc = _index_sockets(disney_node.inputs)
+        
+        # Sockets feeding each input socket, from a single pass over the links (pointer keys)
+        linked_from = {}
+        for link in node_tree.links:
+            linked_from.setdefault(link.to_socket.as_pointer(), []).append(link.from_socket.as_pointer())
+        
+        # Bump socket of Disney node, else any input containing "bump" or "normal"
+        bump_socket = (disney_in_lc.get('bump') or disney_in_lc.get('normal')
+                       or next((input_socket for input_name, input_socket in disney_in_lc.items()
+                                if 'bump' in input_name or 'normal' in input_name), None))
+        
+        # Disney node position, read once for all the nodes placed around it
+        disney_x, disney_y = disney_node.location
         
         # **CREATE COMMON 2D MAPPING NODE**
         mapping_node = None
+        mapping_output = None
         try:
-            # Try different names for 2D Mapping node in LuxCore
-            mapping_node_types = [
-                'LuxCoreNodeTexMapping2D',
-                'LuxCoreNodeMapping2D',
-                'luxcore_tex_mapping2d',
-                'LuxCoreNodeUV',
-            ]
-            
-            for node_type in mapping_node_types:
-                try:
-                    mapping_node = node_tree.nodes.new(type=node_type)
-                    mapping_node.location = (disney_node.location.x - 900, disney_node.location.y)
-                    mapping_node.label = "UV Mapping"
-                    break
-                except:
-                    continue
+            mapping_node = _new_node(node_tree, 'mapping', _MAPPING_NODE_TYPES)
+            if mapping_node:
+                mapping_node.location = (disney_x - 900, disney_y)
+                mapping_node.label = "UV Mapping"
+                
+                # Find mapping node output once, shared by every texture
+                mapping_outputs = {}
+                for output_socket in mapping_node.outputs:
+                    mapping_outputs.setdefault(output_socket.name, output_socket)
+                mapping_output = next((mapping_outputs[output_name] for output_name in _MAPPING_OUTPUT_NAMES
+                                       if output_name in mapping_outputs), None)
         except Exception as e:
             self.report({'WARNING'}, f"Cannot create 2D Mapping node: {str(e)}")
         
-        # Texture mapping with priority
-        texture_mapping = {
-            'orm': {
-                'keywords': ['orm', 'arm', 'mro',
-                           'metallicroughness', 'roughnessmetallic',
-                           'occlusionroughnessmetallic', 'ambientroughnessmetallic'],
-                'socket': None,
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'is_orm': True,
-                'priority': 100
-            },
-            'ors': {
-                'keywords': ['ors', 'occlusionroughnessspecular', 'roughnessspecularocclusion',
-                           'specularroughnessocclusion', 'ambientroughnessspecular',
-                           'occlusionroughnessgloss', 'roughnessglossocclusion'],
-                'socket': None,
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'is_ors': True,
-                'priority': 90
-            },
-            'color': {
-                'keywords': ['color', 'diff', 'diffuse', 'albedo', 'basecolor', 'col', 'base', 
-                           'basecol', 'diffuse', 'dif', 'dff', 'clr', 'colour'],
-                'socket': 'Base Color',
-                'color_space': 'sRGB',
-                'is_color': True,
-                'is_color_map': True,
-                'priority': 80
-            },
-            'emission': {
-                'keywords': ['emission', 'emit', 'emissive', 'emiss', 'glow', 'light'],
-                'socket': 'Emission',
-                'color_space': 'sRGB',
-                'is_color': True,
-                'is_emission': True,
-                'priority': 75
-            },
-            'normal': {
-                'keywords': ['normal', 'norm', 'nrm', 'nor', 'normalmap', 'normal_map', 
-                           'normalgl', 'normal_dx', 'normaldx', 'nrml', 'normals',
-                           'normal_gl', 'norm_gl'],
-                'socket': 'Bump',
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'is_normal': True,
-                'priority': 70
-            },
-            'bump': {
-                'keywords': ['bump', 'bmp', 'bump_map', 'bumpmap'],
-                'socket': 'Bump',
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'is_bump': True,
-                'priority': 65
-            },
-            'metallic': {
-                'keywords': ['metal', 'metallic', 'metallness', 'metalness', 'mtl', 'met', 'metalic'],
-                'socket': 'Metallic',
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'priority': 60
-            },
-            'roughness': {
-                'keywords': ['rough', 'roughness', 'rugosità', 'roughness', 'gloss', 'glossiness',
-                           'rgh', 'roughness', 'rghns', 'rough', 'rug'],
-                'socket': 'Roughness',
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'priority': 50
-            },
-            'specular': {
-                'keywords': ['spec', 'specular', 'specularity', 'spc', 'specular', 'specularlevel'],
-                'socket': 'Specular',
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'priority': 40
-            },
-            'height': {
-                'keywords': ['height', 'disp', 'displacement', 'heightmap', 'height_map',
-                           'hgt', 'displace', 'depth', 'depthmap'],
-                'socket': 'Height',
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'is_height': True,
-                'priority': 30
-            },
-            'opacity': {
-                'keywords': ['opacity', 'alpha', 'transparency', 'transparent', 'opac',
-                           'alph', 'trans', 'op', 'mask'],
-                'socket': 'Opacity',
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'priority': 20
-            },
-            'ao': {
-                'keywords': ['ao', 'ambientocclusion', 'occlusion', 'ambient', 'ambient_occlusion',
-                           'occl', 'ambocc', 'ambientoccl', 'occlusion'],
-                'socket': None,
-                'color_space': 'Non-Color',
-                'is_color': False,
-                'is_ao': True,
-                'priority': 10
-            }
-        }
-        
         # Variables to store special nodes
         color_node = None
         ao_node = None
@@ -236,6 +538,8 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
         height_nodes = []
         orm_node = None
         ors_node = None
+        orm_tex_node = None
+        ors_tex_node = None
         orm_ao_channel = None
         ors_ao_channel = None
         
@@ -250,99 +554,72 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
         
         if self.files:
             for file_elem in self.files:
-                file_list.append({
-                    'path': os.path.join(self.directory, file_elem.name),
-                    'name': file_elem.name
-                })
+                file_list.append(_file_rec(os.path.join(self.directory, file_elem.name), file_elem.name))
         elif self.filepath:
-            file_list.append({
-                'path': self.filepath,
-                'name': os.path.basename(self.filepath)
-            })
+            file_list.append(_file_rec(self.filepath, os.path.basename(self.filepath)))
         else:
             self.report({'ERROR'}, "No file selected!")
             return {'CANCELLED'}
         
         # Identify all textures and their types
-        for file_info in file_list:
-            filepath = file_info['path']
-            filename = file_info['name']
-            filename_lower = filename.lower()
-            filename_no_ext = os.path.splitext(filename_lower)[0]
-            
+        for file_rec in file_list:
             # Determine texture type
-            tex_type = None
-            tex_info = None
-            
-            for type_key, type_info in texture_mapping.items():
-                for keyword in type_info['keywords']:
-                    pattern = r'(^|[_-])' + re.escape(keyword) + r'($|[_-])'
-                    if re.search(pattern, filename_no_ext):
-                        tex_type = type_key
-                        tex_info = type_info
-                        break
-                
-                if tex_type:
-                    break
-            
-            # Search for broader patterns
-            if not tex_type:
-                for type_key, type_info in texture_mapping.items():
-                    for keyword in type_info['keywords']:
-                        if keyword in filename_no_ext:
-                            tex_type = type_key
-                            tex_info = type_info
-                            break
-                    
-                    if tex_type:
-                        break
+            tex_type = _classify(file_rec.lower, self.loose_match)
+            tex_info = _TEXTURE_MAPPING[tex_type] if tex_type else None
             
             # If still not found and user forced a type
             if not tex_type and self.force_type != 'AUTO':
-                force_map = {
-                    'COLOR': 'color',
-                    'NORMAL': 'normal',
-                    'ROUGHNESS': 'roughness',
-                    'METALLIC': 'metallic',
-                    'SPECULAR': 'specular',
-                    'DISPLACEMENT': 'height',
-                    'AO': 'ao',
-                    'ORM': 'orm',
-                    'ORS': 'ors'
-                }
-                if self.force_type in force_map:
-                    tex_type = force_map[self.force_type]
-                    tex_info = texture_mapping[tex_type]
+                if self.force_type in _FORCE_TYPE_MAP:
+                    tex_type = _FORCE_TYPE_MAP[self.force_type]
+                    tex_info = _TEXTURE_MAPPING[tex_type]
             
             if not tex_type or not tex_info:
-                self.report({'WARNING'}, f"Texture not recognized: {filename}")
+                self.report({'WARNING'}, f"Texture not recognized: {file_rec.name}")
                 continue
             
             textures_to_load.append({
-                'filepath': filepath,
-                'filename': filename,
+                'file': file_rec,
                 'type': tex_type,
-                'info': tex_info
+                'info': tex_info,
+                'priority': tex_info.get('priority', 0)
             })
         
         # Sort textures by priority (descending)
-        textures_to_load.sort(key=lambda x: x['info'].get('priority', 0), reverse=True)
+        textures_to_load.sort(key=itemgetter('priority'), reverse=True)
         
         loaded_textures = []
         y_offset = 0
         
         # PHASE 1: Loading and connecting textures in priority order
+        # Links are collected here and in phase 2, and created together once every node exists
+        pending_links = []
+        
+        # State shared with the texture handlers
+        self._node_tree = node_tree
+        self._pending_links = pending_links
+        self._disney_node = disney_node
+        self._disney_in = disney_in
+        self._disney_in_lc = disney_in_lc
+        self._disney_x = disney_x
+        self._disney_y = disney_y
+        self._bump_socket = bump_socket
+        self._linked_from = linked_from
+        self._material_output = material_output
+        
         for tex_data in textures_to_load:
-            filepath = tex_data['filepath']
-            filename = tex_data['filename']
+            file_rec = tex_data['file']
+            filepath = file_rec.path
+            filename = file_rec.name
             tex_type = tex_data['type']
             tex_info = tex_data['info']
             
-            print(f"DEBUG: Processing texture: {filename} as {tex_type}")
+            if _DEBUG:
+                print(f"DEBUG: Processing texture: {filename} as {tex_type}")
             
             # Check if this type is already covered by ORM or ORS
-            if tex_type in ['metallic', 'roughness', 'ao', 'specular'] and tex_type in covered_types:
-                print(f"DEBUG: Texture {tex_type} ({filename}) ignored because already covered by ORM/ORS")
+            if tex_type in _PACKED_CHANNEL_TYPES and tex_type in covered_types:
+                if _DEBUG:
+                    print(f"DEBUG: Texture {tex_type} ({filename}) ignored because already covered by ORM/ORS")
                 continue
             
             # If it's ORM, mark that it covers metallic, roughness and ao
@@ -351,7 +628,8 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
                 covered_types.add('roughness')
                 covered_types.add('ao')
                 orm_node = tex_data
-                print(f"DEBUG: ORM found: {filename}")
+                if _DEBUG:
+                    print(f"DEBUG: ORM found: {filename}")
             
             # If it's ORS, mark that it covers specular, roughness and ao
             elif tex_type == 'ors':
@@ -359,7 +637,8 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
                 covered_types.add('roughness')
                 covered_types.add('ao')
                 ors_node = tex_data
-                print(f"DEBUG: ORS found: {filename}")
+                if _DEBUG:
+                    print(f"DEBUG: ORS found: {filename}")
             
             # Add current type to covered_types
             covered_types.add(tex_type)
@@ -367,19 +646,16 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
             try:
                 # Create image node
                 tex_node = node_tree.nodes.new(type='LuxCoreNodeTexImagemap')
-                tex_node.location = (disney_node.location.x - 600, 
-                                    disney_node.location.y + y_offset)
+                tex_y = disney_y + y_offset
+                tex_node.location = (disney_x - 600, tex_y)
                 y_offset -= 280
                 
-                # Load image
-                if filename in bpy.data.images:
-                    image = bpy.data.images[filename]
-                else:
-                    image = bpy.data.images.load(filepath)
+                # Load image, Blender reuses the one already loaded from the same file
+                image = bpy.data.images.load(filepath, check_existing=True)
                 
                 tex_node.image = image
-                display_name = os.path.splitext(filename)[0]
-                tex_node.label = f"{tex_type.upper()}: {display_name[:15]}..."
+                # Label parts, written to the node once the texture is connected
+                tex_label = [f"{tex_type.upper()}: {file_rec.stem[:15]}..."]
                 
                 # Set color space
                 if hasattr(tex_node, 'color_space'):
@@ -388,506 +664,145 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
                     tex_node.gamma = 2.2 if tex_info['color_space'] == 'sRGB' else 1.0
                 
                 # **CONNECT 2D MAPPING NODE TO TEXTURE**
-                if mapping_node and self.auto_connect:
+                if mapping_node and auto_connect:
                     # Find mapping input in texture
-                    mapping_inputs = ['2D Mapping', 'Mapping', 'UV', 'UV Map', 'UVs', 'Vector']
+                    tex_inputs = {}
+                    for input_socket in tex_node.inputs:
+                        tex_inputs.setdefault(input_socket.name, input_socket)
+                    mapping_input = next((tex_inputs[input_name] for input_name in _MAPPING_INPUT_NAMES
+                                          if input_name in tex_inputs), None)
                     
                     mapping_connected = False
-                    for input_name in mapping_inputs:
-                        if input_name in tex_node.inputs:
-                            # Find mapping node output
-                            mapping_outputs = ['2D Mapping', 'Mapping', 'UV', 'Vector', 'Output']
-                            for output_name in mapping_outputs:
-                                if output_name in mapping_node.outputs:
-                                    node_tree.links.new(
-                                        mapping_node.outputs[output_name],
-                                        tex_node.inputs[input_name]
-                                    )
-                                    mapping_connected = True
-                                    tex_node.label += " [UV]"
-                                    break
-                            if mapping_connected:
-                                break
+                    if mapping_input and mapping_output:
+                        pending_links.append((mapping_output, mapping_input))
+                        mapping_connected = True
+                        tex_label.append(" [UV]")
                     
                     if not mapping_connected:
                         # If not found by name, try first inputs/outputs
                         if len(mapping_node.outputs) > 0 and len(tex_node.inputs) > 0:
                             # Check that input is not already used for something else (like "Color")
                             input_socket = tex_node.inputs[0]
-                            input_name = input_socket.name.lower() if hasattr(input_socket, 'name') else ""
+                            input_name = input_socket.name.lower()
                             if 'color' not in input_name and 'height' not in input_name:
-                                node_tree.links.new(
+                                pending_links.append((
                                     mapping_node.outputs[0],
                                     tex_node.inputs[0]
-                                )
-                                tex_node.label += " [UV0]"
+                                ))
+                                tex_label.append(" [UV0]")
                 
                 # Store special nodes for later
                 if tex_type == 'color':
                     color_node = tex_node
-                    tex_node.label += " [Color]"
+                    tex_label.append(" [Color]")
                 elif tex_type == 'ao':
                     ao_node = tex_node
-                    tex_node.label += " [AO]"
+                    tex_label.append(" [AO]")
                 elif tex_type == 'normal':
                     normal_nodes.append(tex_node)
-                    tex_node.label += " [Normal]"
+                    tex_label.append(" [Normal]")
                 elif tex_type == 'bump':
                     bump_nodes.append(tex_node)
-                    tex_node.label += " [Bump]"
+                    tex_label.append(" [Bump]")
                 elif tex_type == 'height':
                     height_nodes.append(tex_node)
-                    tex_node.label += " [Height]"
-                
-                # Setup for normal map (with Normalmap checkbox activated)
-                if tex_type == 'normal' and self.auto_connect:
-                    # Set intensity
-                    bump_props = ['bump_height', 'height', 'strength', 'normal_strength']
-                    for prop_name in bump_props:
-                        if hasattr(tex_node, prop_name):
-                            setattr(tex_node, prop_name, normal_strength)
-                            break
-                    
-                    # Activate Normalmap checkbox on texture node
-                    if hasattr(tex_node, 'normalmap'):
-                        tex_node.normalmap = True
-                    
-                    # Connect to Bump socket of Disney node
-                    socket_names_to_try = ['Bump', 'bump', 'Normal', 'normal']
-                    socket_found = None
-                    
-                    for socket_name in socket_names_to_try:
-                        if socket_name in disney_node.inputs:
-                            socket_found = disney_node.inputs[socket_name]
-                            break
-                    
-                    # If not found by name, try to find any input containing "bump" or "normal"
-                    if not socket_found:
-                        for input_socket in disney_node.inputs:
-                            input_name = input_socket.name.lower()
-                            if 'bump' in input_name or 'normal' in input_name:
-                                socket_found = input_socket
-                                break
-                    
-                    if socket_found and 'Color' in tex_node.outputs:
-                        node_tree.links.new(
-                            tex_node.outputs['Color'],
-                            socket_found
-                        )
-                        tex_node.label += " →Bump"
-                
-                # Setup for bump map (with intermediate Bump node)
-                elif tex_type == 'bump' and self.auto_connect:
-                    # Create intermediate Bump node
-                    try:
-                        bump_node = node_tree.nodes.new(type='LuxCoreNodeTexBump')
-                        bump_node.location = (tex_node.location.x + 300, tex_node.location.y)
-                        bump_node.label = "Bump"
-                        
-                        # Set Sampling Distance to 0.001 and Bump Height to 0.01
-                        if hasattr(bump_node, 'inputs'):
-                            for inp in bump_node.inputs:
-                                inp_name = inp.name.lower()
-                                if 'sampling' in inp_name or 'distance' in inp_name:
-                                    if hasattr(inp, 'default_value'):
-                                        try:
-                                            inp.default_value = 0.001
-                                        except:
-                                            pass
-                                elif 'height' in inp_name or 'bump height' in inp_name:
-                                    if hasattr(inp, 'default_value'):
-                                        try:
-                                            inp.default_value = 0.01
-                                        except:
-                                            pass
-                        
-                        # Connect texture Color output to Bump node Value input
-                        if 'Color' in tex_node.outputs:
-                            value_input = None
-                            for inp in bump_node.inputs:
-                                if 'value' in inp.name.lower():
-                                    value_input = inp
-                                    break
-                            if value_input:
-                                node_tree.links.new(tex_node.outputs['Color'], value_input)
-                        
-                        # Connect Bump node output to Disney Bump socket
-                        socket_names_to_try = ['Bump', 'bump', 'Normal', 'normal']
-                        socket_found = None
-                        
-                        for socket_name in socket_names_to_try:
-                            if socket_name in disney_node.inputs:
-                                socket_found = disney_node.inputs[socket_name]
-                                break
-                        
-                        if not socket_found:
-                            for input_socket in disney_node.inputs:
-                                input_name = input_socket.name.lower()
-                                if 'bump' in input_name or 'normal' in input_name:
-                                    socket_found = input_socket
-                                    break
-                        
-                        if socket_found and 'Bump' in bump_node.outputs:
-                            node_tree.links.new(bump_node.outputs['Bump'], socket_found)
-                            tex_node.label += " →Bump Node"
-                        
-                        # NOTE: 2D Mapping is connected to the TEXTURE node, not the Bump node
-                        # This is already done earlier in the texture loading loop
-                        
-                    except Exception as e:
-                        print(f"Error creating Bump node: {str(e)}")
-                        # Fallback: connect directly to Disney
-                        socket_found = None
-                        for socket_name in ['Bump', 'bump']:
-                            if socket_name in disney_node.inputs:
-                                socket_found = disney_node.inputs[socket_name]
-                                break
-                        if socket_found and 'Color' in tex_node.outputs:
-                            node_tree.links.new(tex_node.outputs['Color'], socket_found)
+                    tex_label.append(" [Height]")
                 
-                # Setup for height/displacement map
-                elif tex_type == 'height' and self.auto_connect:
-                    # Check if Material Output node already exists, otherwise create it
-                    if not material_output:
-                        try:
-                            material_output = node_tree.nodes.new(type='LuxCoreNodeMatOutput')
-                            material_output.location = (disney_node.location.x + 400, disney_node.location.y)
-                            material_output.label = "Material Output"
-                            self.report({'INFO'}, "Created new LuxCore Material Output")
-                        except Exception as e:
-                            self.report({'ERROR'}, f"Cannot create LuxCore Material Output node: {str(e)}")
-                            tex_node.label += " [No Output Node]"
-                            continue
-                    
-                    # Make sure Disney node is connected to material output
-                    if disney_node.outputs and 'Material' in disney_node.outputs and material_output.inputs and 'Material' in material_output.inputs:
-                        disney_output = disney_node.outputs['Material']
-                        material_input = material_output.inputs['Material']
-                        
-                        # Check if already connected
-                        already_connected = False
-                        for link in node_tree.links:
-                            if link.to_socket == material_input and link.from_socket == disney_output:
-                                already_connected = True
-                                break
-                        
-                        if not already_connected:
-                            node_tree.links.new(disney_output, material_input)
-                    
-                    # List of possible names for displacement node
-                    displacement_node_types = [
-                        'LuxCoreNodeMatHeightDisplacement',
-                        'LuxCoreNodeMatDisplacement',
-                        'LuxCoreNodeDisplacement',
-                        'luxcore_material_height_displacement',
-                        'luxcore_material_displacement',
-                    ]
-                    
-                    displacement_node = None
-                    
-                    for node_type in displacement_node_types:
-                        try:
-                            displacement_node = node_tree.nodes.new(type=node_type)
-                            break
-                        except:
-                            continue
-                    
-                    # If not found, try to search all LuxCore nodes
-                    if not displacement_node:
-                        for cls in bpy.types.Node.__subclasses__():
-                            cls_name = cls.__name__
-                            if 'LuxCore' in cls_name and ('displacement' in cls_name.lower() or 'height' in cls_name.lower()):
-                                try:
-                                    displacement_node = node_tree.nodes.new(type=cls_name)
-                                    break
-                                except:
-                                    continue
-                    
-                    if displacement_node:
-                        displacement_node.location = (disney_node.location.x - 300, tex_node.location.y)
-                        displacement_node.label = "Height Displacement"
-                        
-                        # Set displacement height
-                        height_props = ['height', 'value', 'strength', 'displacement_height']
-                        for prop_name in height_props:
-                            if hasattr(displacement_node, prop_name):
-                                setattr(displacement_node, prop_name, displacement_height)
-                                break
-                        
-                        # Set Scale value to 0.02
-                        scale_props = ['scale', 'Scale', 'scaling', 'factor', 'multiplier', 'height_scale']
-                        for prop_name in scale_props:
-                            if hasattr(displacement_node, prop_name):
-                                try:
-                                    setattr(displacement_node, prop_name, 0.02)
-                                    tex_node.label += " [Scale:0.02]"
-                                    break
-                                except (AttributeError, TypeError):
-                                    continue
-                        
-                        # ENABLE SMOOTH NORMALS
-                        smooth_normals_props = ['normal_smooth', 'smooth_normals', 'smooth_normal', 'normal_smoothing']
-                        for prop_name in smooth_normals_props:
-                            if hasattr(displacement_node, prop_name):
-                                try:
-                                    setattr(displacement_node, prop_name, True)
-                                    tex_node.label += " [Smooth]"
-                                    print(f"DEBUG: Enabled smooth normals on {displacement_node.name}")
-                                    break
-                                except (AttributeError, TypeError):
-                                    continue
-                        
-                        # Connect texture to displacement node
-                        if 'Color' in tex_node.outputs:
-                            # Try different input names
-                            input_names = ['Height', 'height', 'Displacement', 'displacement', 'Texture', 'texture', 'Input']
-                            for input_name in input_names:
-                                if input_name in displacement_node.inputs:
-                                    node_tree.links.new(
-                                        tex_node.outputs['Color'],
-                                        displacement_node.inputs[input_name]
-                                    )
-                                    tex_node.label += " →Height"
-                                    break
-                            else:
-                                # If not found by name, try first input
-                                if len(displacement_node.inputs) > 0:
-                                    node_tree.links.new(
-                                        tex_node.outputs['Color'],
-                                        displacement_node.inputs[0]
-                                    )
-                                    tex_node.label += " →Input0"
-                        
-                        # Crea nodo Subdivision
-                        subdivision_node = None
-                        try:
-                            subdivision_node = node_tree.nodes.new(type='LuxCoreNodeShapeSubdiv')
-                            subdivision_node.location = (displacement_node.location.x - 250, displacement_node.location.y + 150)
-                            subdivision_node.label = "Subdivision"
-                        except Exception as e:
-                            print(f"Error creating Subdivision node: {str(e)}")
-                        
-                        # Collega Subdivision → Height Displacement (input Shape)
-                        if subdivision_node and hasattr(displacement_node, 'inputs'):
-                            shape_input_disp = None
-                            for inp in displacement_node.inputs:
-                                if inp.name == 'Shape' or 'shape' in inp.name.lower():
-                                    shape_input_disp = inp
-                                    break
-                            
-                            if shape_input_disp and hasattr(subdivision_node, 'outputs'):
-                                shape_output_subdiv = None
-                                for out in subdivision_node.outputs:
-                                    if out.name == 'Shape' or 'shape' in out.name.lower():
-                                        shape_output_subdiv = out
-                                        break
-                                if not shape_output_subdiv and len(subdivision_node.outputs) > 0:
-                                    shape_output_subdiv = subdivision_node.outputs[0]
-                                
-                                if shape_output_subdiv:
-                                    node_tree.links.new(shape_output_subdiv, shape_input_disp)
-                                    tex_node.label += " +Subdiv"
-                        
-                        # Connect "Shape" output of Height Displacement node to Material Output
-                        if material_output:
-                            # Find "Shape" output in displacement node
-                            if 'Shape' in displacement_node.outputs:
-                                # Find "Displacement" or "Shape" input in Material Output
-                                input_names = ['Displacement', 'displacement', 'Shape', 'shape']
-                                connected = False
-                                for input_name in input_names:
-                                    if input_name in material_output.inputs:
-                                        node_tree.links.new(
-                                            displacement_node.outputs['Shape'],
-                                            material_output.inputs[input_name]
-                                        )
-                                        tex_node.label += " →" + input_name
-                                        connected = True
-                                        break
-                                if not connected:
-                                    self.report({'WARNING'}, "Input for displacement not found in Material Output")
-                            else:
-                                # If "Shape" not found, try other outputs
-                                for output_name in ['Displacement', 'displacement', 'Height', 'height', 'Vector', 'vector']:
-                                    if output_name in displacement_node.outputs:
-                                        # Try different inputs in Material Output
-                                        for input_name in ['Displacement', 'displacement', 'Shape', 'shape']:
-                                            if input_name in material_output.inputs:
-                                                node_tree.links.new(
-                                                    displacement_node.outputs[output_name],
-                                                    material_output.inputs[input_name]
-                                                )
-                                                tex_node.label += f" →{input_name}"
-                                                break
-                                        break
-                                else:
-                                    self.report({'WARNING'}, "Cannot connect displacement to Material Output")
-                                    tex_node.label += " [No Output]"
-                        else:
-                            self.report({'WARNING'}, "No Material Output found")
-                            tex_node.label += " [No Output]"
-                    else:
-                        self.report({'ERROR'}, "Cannot create displacement node")
-                        tex_node.label += " [No Disp Node]"
+                # Connect texture with the handler of its type
+                keep_texture = True
+                if auto_connect:
+                    handler_name = self._TEX_HANDLERS.get(tex_type, '_connect_direct')
+                    if handler_name:
+                        keep_texture = getattr(self, handler_name)(tex_type, tex_node, tex_info, tex_y, tex_label)
                 
-                # Setup for other textures (metallic, roughness, specular, opacity)
-                elif tex_type == 'emission' and self.auto_connect:
-                    # Emission requires an intermediate Emission node (LuxCoreNodeMatEmission)
-                    try:
-                        emission_node = node_tree.nodes.new(type='LuxCoreNodeMatEmission')
-                    except Exception as e:
-                        self.report({'WARNING'}, f"Cannot create Emission node: {e}")
-                        tex_node.label += " [No Emission Node]"
-                        continue
-                    
-                    emission_node.location = (disney_node.location.x - 300, tex_node.location.y)
-                    emission_node.label = "Emission"
-                    
-                    # Connect texture to Emission node Color input
-                    if 'Color' in tex_node.outputs:
-                        color_input = None
-                        for input_socket in emission_node.inputs:
-                            if 'color' in input_socket.name.lower():
-                                color_input = input_socket
-                                break
-                        
-                        if color_input:
-                            node_tree.links.new(tex_node.outputs['Color'], color_input)
-                            tex_node.label += " →Emission"
-                    
-                    # Connect Emission node to Disney node Emission input
-                    if len(emission_node.outputs) > 0:
-                        emission_output = emission_node.outputs[0]
-                        if 'Emission' in disney_node.inputs:
-                            node_tree.links.new(emission_output, disney_node.inputs['Emission'])
-                        else:
-                            # Try alternative names
-                            for input_socket in disney_node.inputs:
-                                if 'emission' in input_socket.name.lower() or 'emit' in input_socket.name.lower():
-                                    node_tree.links.new(emission_output, input_socket)
-                                    break
+                tex_node.label = "".join(tex_label)
+                if not keep_texture:
+                    continue
                 
-                # Setup for other textures (metallic, roughness, specular, opacity)
-                elif tex_type not in ['color', 'ao', 'normal', 'height', 'emission', 'orm', 'ors'] and tex_info['socket'] and tex_info['socket'] in disney_node.inputs and self.auto_connect:
-                    if 'Color' in tex_node.outputs:
-                        node_tree.links.new(
-                            tex_node.outputs['Color'],
-                            disney_node.inputs[tex_info['socket']]
-                        )
-                        tex_node.label += " →" + tex_info['socket']
+                loaded_textures.append(_LoadedTex(tex_type, filename, tex_node))
                 
-                loaded_textures.append({
-                    'type': tex_type,
-                    'name': filename,
-                    'node': tex_node
-                })
+                # Keep the first loaded ORM and ORS texture nodes for phase 2
+                if tex_type == 'orm' and not orm_tex_node:
+                    orm_tex_node = tex_node
+                elif tex_type == 'ors' and not ors_tex_node:
+                    ors_tex_node = tex_node
                 
             except Exception as e:
                 self.report({'WARNING'}, f"Error loading {filename}: {str(e)}")
                 continue
         
+        # A height texture may have created the Material Output
+        material_output = self._material_output
+        
         # PHASE 2: Handling combined ORM and ORS textures
-        if orm_node and self.auto_connect:
-            print(f"DEBUG: Found ORM texture: {orm_node['filename']}")
-            # Find corresponding texture node
-            orm_tex_node = None
-            for tex in loaded_textures:
-                if tex['type'] == 'orm':
-                    orm_tex_node = tex['node']
-                    break
+        if orm_node and auto_connect:
+            if _DEBUG:
+                print(f"DEBUG: Found ORM texture: {orm_node['file'].name}")
             
             if orm_tex_node:
-                orm_ao_channel = self.setup_orm_texture(node_tree, disney_node, orm_tex_node, color_node)
+                orm_ao_channel = self.setup_orm_texture(node_tree, disney_node, orm_tex_node, color_node,
+                                                        disney_in, disney_in_lc)
                 orm_tex_node.label = f"ORM: {orm_tex_node.label}"
         
-        if ors_node and self.auto_connect:
-            print(f"DEBUG: Found ORS texture: {ors_node['filename']}")
-            # Find corresponding texture node
-            ors_tex_node = None
-            for tex in loaded_textures:
-                if tex['type'] == 'ors':
-                    ors_tex_node = tex['node']
-                    break
+        if ors_node and auto_connect:
+            if _DEBUG:
+                print(f"DEBUG: Found ORS texture: {ors_node['file'].name}")
             
             if ors_tex_node:
-                ors_ao_channel = self.setup_ors_texture(node_tree, disney_node, ors_tex_node, color_node)
+                ors_ao_channel = self.setup_ors_texture(node_tree, disney_node, ors_tex_node, color_node,
+                                                        disney_in, disney_in_lc)
                 ors_tex_node.label = f"ORS: {ors_tex_node.label}"
         
         # **ACTIVATE NORMALMAP CHECKBOX**
         for normal_node in normal_nodes:
             try:
                 # Try different property names for Normalmap
-                normalmap_props = [
-                    'normalmap', 
-                    'normal_map', 
-                    'use_normalmap', 
-                    'use_normal_map', 
-                    'is_normalmap',
-                    'normal',
-                    'as_normal'
-                ]
+                normalmap_props, normal_bool_props = _normalmap_props(type(normal_node))
                 
                 activated = False
                 for prop_name in normalmap_props:
-                    if hasattr(normal_node, prop_name):
+                    try:
+                        setattr(normal_node, prop_name, True)
+                        normal_node.label += " [Normalmap ON]"
+                        activated = True
+                        break
+                    except:
+                        continue
+                
+                if not activated:
+                    # If property not found, try the boolean 'normal' properties of the node
+                    for attr in normal_bool_props:
                         try:
-                            setattr(normal_node, prop_name, True)
-                            normal_node.label += " [Normalmap ON]"
-                            activated = True
+                            setattr(normal_node, attr, True)
+                            normal_node.label += " [" + attr + " ON]"
                             break
                         except:
                             continue
-                
-                if not activated:
-                    # If property not found, try searching all node properties
-                    for attr in dir(normal_node):
-                        if not attr.startswith('_') and 'normal' in attr.lower():
-                            try:
-                                # Try to set it to True if boolean
-                                value = getattr(normal_node, attr)
-                                if isinstance(value, bool):
-                                    setattr(normal_node, attr, True)
-                                    normal_node.label += f" [{attr} ON]"
-                                    break
-                            except:
-                                continue
             except Exception as e:
                 self.report({'WARNING'}, f"Cannot activate Normalmap for {normal_node.label}: {str(e)}")
         
+        # Color outputs of the color and AO textures and the Base Color input, looked up once
+        color_tex_output = color_node.outputs.get('Color') if color_node else None
+        ao_tex_output = ao_node.outputs.get('Color') if ao_node else None
+        base_color_input = disney_in.get('Base Color')
+        
         # **SETUP FOR AO (AMBIENT OCCLUSION)**
         # Create node to combine Color and AO
         ao_channel = None
-        if ao_node and 'Color' in ao_node.outputs:
-            ao_channel = ao_node.outputs['Color']
+        if ao_tex_output:
+            ao_channel = ao_tex_output
         elif orm_ao_channel:
             ao_channel = orm_ao_channel
         elif ors_ao_channel:
             ao_channel = ors_ao_channel
         
-        if self.auto_connect and color_node and ao_channel:
+        if auto_connect and color_node and ao_channel:
             try:
-                # In LuxCore, we might use a Math node to multiply textures
-                mix_node_types = [
-                    'LuxCoreNodeTexMath',  # Most likely
-                    'LuxCoreNodeMath',
-                    'LuxCoreNodeTexMix',
-                    'LuxCoreNodeTexMixColor',
-                    'luxcore_tex_math',
-                    'luxcore_tex_mix',
-                ]
-                
-                mix_node = None
-                for node_type in mix_node_types:
-                    try:
-                        mix_node = node_tree.nodes.new(type=node_type)
-                        break
-                    except:
-                        continue
+                mix_node = _new_node(node_tree, 'mix', _MIX_NODE_TYPES)
                 
                 if mix_node:
-                    mix_node.location = (disney_node.location.x - 200, 
-                                        color_node.location.y)
-                    mix_node.label = "AO Multiply"
+                    mix_node.location = (disney_x - 200, color_node.location.y)
+                    mix_label = ["AO Multiply"]
                     
                     # Set operation to Multiply if available
                     if hasattr(mix_node, 'operation'):
@@ -907,81 +822,89 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
                     ao_connected = False
                     
                     for i, input_socket in enumerate(mix_node.inputs):
-                        if hasattr(input_socket, 'name'):
-                            input_name = input_socket.name.lower()
-                            # Try different names for first input (color)
-                            if not color_connected and ('value1' in input_name or 'input1' in input_name or 'a' in input_name or 'color1' in input_name or i == 0):
-                                if 'Color' in color_node.outputs:
-                                    node_tree.links.new(color_node.outputs['Color'], input_socket)
-                                    color_connected = True
-                                    color_node.label += " →Math"
-                            # Try different names for second input (ao)
-                            elif not ao_connected and ('value2' in input_name or 'input2' in input_name or 'b' in input_name or 'color2' in input_name or i == 1):
-                                node_tree.links.new(ao_channel, input_socket)
-                                ao_connected = True
-                                if ao_node:
-                                    ao_node.label += " →Math"
+                        # Whole socket name without spaces, so 'a' does not match 'Value 2'
+                        input_name = input_socket.name.lower().replace(' ', '')
+                        # Try different names for first input (color)
+                        if not color_connected and (i == 0 or input_name in _FIRST_INPUT_KEYS):
+                            if color_tex_output:
+                                pending_links.append((color_tex_output, input_socket))
+                                color_connected = True
+                                color_node.label += _LBL_MATH
+                        # Try different names for second input (ao)
+                        elif not ao_connected and (i == 1 or input_name in _SECOND_INPUT_KEYS):
+                            pending_links.append((ao_channel, input_socket))
+                            ao_connected = True
+                            if ao_node:
+                                ao_node.label += _LBL_MATH
                     
                     # If not found by name, try first two inputs
                     if not color_connected and len(mix_node.inputs) > 0:
-                        if 'Color' in color_node.outputs:
-                            node_tree.links.new(color_node.outputs['Color'], mix_node.inputs[0])
+                        if color_tex_output:
+                            pending_links.append((color_tex_output, mix_node.inputs[0]))
                             color_connected = True
-                            color_node.label += " →Math"
+                            color_node.label += _LBL_MATH
                     
                     if not ao_connected and len(mix_node.inputs) > 1:
-                        node_tree.links.new(ao_channel, mix_node.inputs[1])
+                        pending_links.append((ao_channel, mix_node.inputs[1]))
                         ao_connected = True
                         if ao_node:
-                            ao_node.label += " →Math"
+                            ao_node.label += _LBL_MATH
                     
                     # Connect Math node output to Disney's Base Color
                     if color_connected and ao_connected:
                         if len(mix_node.outputs) > 0:
                             output_socket = None
                             for out_socket in mix_node.outputs:
-                                if hasattr(out_socket, 'name'):
-                                    out_name = out_socket.name.lower()
-                                    if 'value' in out_name or 'color' in out_name or 'result' in out_name:
-                                        output_socket = out_socket
-                                        break
+                                out_name = out_socket.name.lower()
+                                if 'value' in out_name or 'color' in out_name or 'result' in out_name:
+                                    output_socket = out_socket
+                                    break
                             
                             if not output_socket:
                                 output_socket = mix_node.outputs[0]
                             
-                            if 'Base Color' in disney_node.inputs:
-                                node_tree.links.new(output_socket, disney_node.inputs['Base Color'])
-                                mix_node.label += " →Base Color"
+                            if base_color_input:
+                                pending_links.append((output_socket, base_color_input))
+                                mix_label.append(_LBL_BASE_COLOR)
                             else:
                                 self.report({'WARNING'}, "Socket 'Base Color' not found in Disney node")
                         else:
                             self.report({'WARNING'}, "Math node has no output")
                     else:
                         self.report({'WARNING'}, "Cannot connect both textures to Math node")
+                    
+                    mix_node.label = "".join(mix_label)
                 
                 else:
                     self.report({'WARNING'}, "Math node not available. AO connection not possible.")
                     # Connect only color texture
-                    if 'Color' in color_node.outputs and 'Base Color' in disney_node.inputs:
-                        node_tree.links.new(color_node.outputs['Color'], disney_node.inputs['Base Color'])
-                        color_node.label += " →Base Color"
+                    if color_tex_output and base_color_input:
+                        pending_links.append((color_tex_output, base_color_input))
+                        color_node.label += _LBL_BASE_COLOR
                     
             except Exception as e:
                 self.report({'WARNING'}, f"Error creating Math node for AO: {str(e)}")
                 # In case of error, connect only color texture
-                if 'Color' in color_node.outputs and 'Base Color' in disney_node.inputs:
-                    node_tree.links.new(color_node.outputs['Color'], disney_node.inputs['Base Color'])
-                    color_node.label += " →Base Color"
+                if color_tex_output and base_color_input:
+                    pending_links.append((color_tex_output, base_color_input))
+                    color_node.label += _LBL_BASE_COLOR
         
         # If we only have color texture (without AO), connect it directly
-        elif self.auto_connect and color_node and not ao_channel:
-            if 'Color' in color_node.outputs and 'Base Color' in disney_node.inputs:
-                node_tree.links.new(color_node.outputs['Color'], disney_node.inputs['Base Color'])
-                color_node.label += " →Base Color"
+        elif auto_connect and color_node and not ao_channel:
+            if color_tex_output and base_color_input:
+                pending_links.append((color_tex_output, base_color_input))
+                color_node.label += _LBL_BASE_COLOR
+        
+        # Create every collected link in one pass, after all the nodes exist
+        for from_socket, to_socket in pending_links:
+            try:
+                node_tree.links.new(from_socket, to_socket)
+            except Exception as e:
+                self.report({'WARNING'}, f"Cannot connect {from_socket.name} to {to_socket.name}: {str(e)}")
         
         # Final report
         if loaded_textures:
-            types_str = ", ".join([f"{t['type']}" for t in loaded_textures])
+            types_str = ", ".join(tex.type for tex in loaded_textures)
             
             if mapping_node:
                 self.report({'INFO'}, f"Textures loaded: {len(loaded_textures)} - {types_str} - Shared UV Mapping")
@@ -998,178 +921,411 @@ class LUXCORE_OT_select_pbr_textures(Operator, ImportHelper):
         
         return {'FINISHED'}
     
-    def setup_orm_texture(self, node_tree, disney_node, orm_node, color_node):
-        """Configure an ORM (OcclusionRoughnessMetallic) texture"""
+    def _connect_normal(self, tex_type, tex_node, tex_info, tex_y, tex_label):
+        """Connect a normal map to the Bump socket of the Disney node"""
+        pending_links = self._pending_links
+        bump_socket = self._bump_socket
+        color_output = tex_node.outputs.get('Color')
+        
+        # Set intensity
+        prop_name = _resolve_prop(type(tex_node), _NORMAL_STRENGTH_PROPS)
+        if prop_name:
+            setattr(tex_node, prop_name, _NORMAL_STRENGTH)
+        
+        # Activate Normalmap checkbox on texture node
+        if hasattr(tex_node, 'normalmap'):
+            tex_node.normalmap = True
+        
+        # Connect to Bump socket of Disney node
+        if bump_socket and color_output:
+            pending_links.append((
+                color_output,
+                bump_socket
+            ))
+            tex_label.append(" →Bump")
+        
+        return True
+    
+    def _connect_bump(self, tex_type, tex_node, tex_info, tex_y, tex_label):
+        """Connect a bump map through an intermediate Bump node"""
+        node_tree = self._node_tree
+        pending_links = self._pending_links
+        bump_socket = self._bump_socket
+        disney_in_lc = self._disney_in_lc
+        disney_x = self._disney_x
+        color_output = tex_node.outputs.get('Color')
+        
+        # Create intermediate Bump node
         try:
-            print(f"DEBUG: Configuring ORM texture: {orm_node.name}")
+            bump_node = _new_node(node_tree, 'bump', _BUMP_NODE_TYPES)
+            if not bump_node:
+                raise RuntimeError("Bump node type not available")
+            bump_node.location = (disney_x - 300, tex_y)
+            bump_node.label = "Bump"
             
-            # Create SplitFloat3 node
+            # Set Sampling Distance to 0.001 and Bump Height to 0.01
+            for inp in bump_node.inputs:
+                inp_name = inp.name.lower()
+                if 'sampling' in inp_name or 'distance' in inp_name:
+                    if hasattr(inp, 'default_value'):
+                        try:
+                            inp.default_value = 0.001
+                        except:
+                            pass
+                elif 'height' in inp_name or 'bump height' in inp_name:
+                    if hasattr(inp, 'default_value'):
+                        try:
+                            inp.default_value = 0.01
+                        except:
+                            pass
+            
+            # Connect texture Color output to Bump node Value input
+            if color_output:
+                value_input = None
+                for inp in bump_node.inputs:
+                    if 'value' in inp.name.lower():
+                        value_input = inp
+                        break
+                if value_input:
+                    pending_links.append((color_output, value_input))
+            
+            # Connect Bump node output to Disney Bump socket
+            bump_output = bump_node.outputs.get('Bump')
+            if bump_socket and bump_output:
+                pending_links.append((bump_output, bump_socket))
+                tex_label.append(" →Bump Node")
+            
+            # NOTE: 2D Mapping is connected to the TEXTURE node, not the Bump node
+            # This is already done earlier in the texture loading loop
+        
+        except Exception as e:
+            print(f"Error creating Bump node: {str(e)}")
+            # Fallback: connect directly to Disney
+            socket_found = disney_in_lc.get('bump')
+            if socket_found and color_output:
+                pending_links.append((color_output, socket_found))
+        
+        return True
+    
+    def _connect_height(self, tex_type, tex_node, tex_info, tex_y, tex_label):
+        """Connect a height map through Height Displacement and Subdivision nodes to the Material Output"""
+        node_tree = self._node_tree
+        pending_links = self._pending_links
+        disney_node = self._disney_node
+        linked_from = self._linked_from
+        material_output = self._material_output
+        disney_x = self._disney_x
+        disney_y = self._disney_y
+        color_output = tex_node.outputs.get('Color')
+        
+        # Check if Material Output node already exists, otherwise create it
+        if not material_output:
             try:
-                split_node = node_tree.nodes.new(type="LuxCoreNodeTexSplitFloat3")
-                split_node.location = (disney_node.location.x - 400, orm_node.location.y)
-                split_node.label = "Split ORM"
+                material_output = node_tree.nodes.new(type='LuxCoreNodeMatOutput')
+                material_output.location = (disney_x + 400, disney_y)
+                material_output.label = "Material Output"
+                self._material_output = material_output
+                self.report({'INFO'}, "Created new LuxCore Material Output")
             except Exception as e:
-                print(f"DEBUG: Cannot create SplitFloat3 node: {str(e)}")
-                return None
+                self.report({'ERROR'}, f"Cannot create LuxCore Material Output node: {str(e)}")
+                tex_label.append(" [No Output Node]")
+                return False
+        
+        # Make sure Disney node is connected to material output
+        material_in = _index_sockets(material_output.inputs)[0]
+        disney_output = disney_node.outputs.get('Material')
+        material_input = material_in.get('Material')
+        if disney_output and material_input:
             
-            # Connect ORM texture to SplitFloat3 node
-            if hasattr(orm_node, 'outputs') and len(orm_node.outputs) > 0:
-                if hasattr(split_node, 'inputs') and len(split_node.inputs) > 0:
-                    # Use 'Color' output of ORM texture
-                    color_output = None
-                    for output in orm_node.outputs:
-                        if output.name.lower() in ['color', 'image', 'value']:
-                            color_output = output
-                            break
-                    if not color_output and len(orm_node.outputs) > 0:
-                        color_output = orm_node.outputs[0]
-                    
-                    if color_output:
-                        node_tree.links.new(color_output, split_node.inputs[0])
-                        print(f"DEBUG: ORM connected to SplitFloat3")
+            # Check if already connected (or already queued by a previous height texture)
+            material_sources = linked_from.setdefault(material_input.as_pointer(), [])
+            if disney_output.as_pointer() not in material_sources:
+                pending_links.append((disney_output, material_input))
+                material_sources.append(disney_output.as_pointer())
+        
+        # First working type is cached, so the search over all LuxCore nodes runs only once
+        displacement_node = _new_node(node_tree, 'displacement', _DISPLACEMENT_NODE_TYPES,
+                                      _is_luxcore_displacement)
+        
+        if displacement_node:
+            displacement_node.location = (disney_x - 300, tex_y)
+            displacement_node.label = "Height Displacement"
             
-            # Connect separate channels:
-            # Channel G (1) -> Roughness
-            # Channel B (2) -> Metallic
-            # Channel R (0) -> AO (multiply with color if exists)
+            # Set displacement height
+            displacement_cls = type(displacement_node)
+            prop_name = _resolve_prop(displacement_cls, _DISPLACEMENT_HEIGHT_PROPS)
+            if prop_name:
+                setattr(displacement_node, prop_name, _DISPLACEMENT_HEIGHT)
             
-            # 1. Roughness (channel G/green) - output[1]
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 1:
-                roughness_output = split_node.outputs[1]  # Channel G
-                if 'Roughness' in disney_node.inputs:
-                    node_tree.links.new(roughness_output, disney_node.inputs['Roughness'])
-                    print(f"DEBUG: Channel G (Roughness) connected")
-                else:
-                    # Try to find roughness socket with alternative names
-                    for input_socket in disney_node.inputs:
-                        if 'rough' in input_socket.name.lower():
-                            node_tree.links.new(roughness_output, input_socket)
-                            print(f"DEBUG: Channel G (Roughness) connected to {input_socket.name}")
-                            break
+            # Set Scale value to 0.02
+            prop_name = _resolve_prop(displacement_cls, _DISPLACEMENT_SCALE_PROPS)
+            if prop_name:
+                try:
+                    setattr(displacement_node, prop_name, 0.02)
+                    tex_label.append(" [Scale:0.02]")
+                except (AttributeError, TypeError):
+                    pass
+            
+            # ENABLE SMOOTH NORMALS
+            prop_name = _resolve_prop(displacement_cls, _SMOOTH_NORMALS_PROPS)
+            if prop_name:
+                try:
+                    setattr(displacement_node, prop_name, True)
+                    tex_label.append(" [Smooth]")
+                    if _DEBUG:
+                        print(f"DEBUG: Enabled smooth normals on {displacement_node.name}")
+                except (AttributeError, TypeError):
+                    pass
             
-            # 2. Metallic (channel B/blue) - output[2]
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 2:
-                metallic_output = split_node.outputs[2]  # Channel B
-                if 'Metallic' in disney_node.inputs:
-                    node_tree.links.new(metallic_output, disney_node.inputs['Metallic'])
-                    print(f"DEBUG: Channel B (Metallic) connected")
+            # Connect texture to displacement node
+            displacement_in, displacement_in_lc = _index_sockets(displacement_node.inputs)
+            if color_output:
+                # Try different input names
+                height_input = next((displacement_in[input_name] for input_name in _DISPLACEMENT_INPUT_NAMES
+                                     if input_name in displacement_in), None)
+                if height_input:
+                    pending_links.append((
+                        color_output,
+                        height_input
+                    ))
+                    tex_label.append(" →Height")
                 else:
-                    # Try to find metallic socket with alternative names
-                    for input_socket in disney_node.inputs:
-                        if 'metal' in input_socket.name.lower():
-                            node_tree.links.new(metallic_output, input_socket)
-                            print(f"DEBUG: Channel B (Metallic) connected to {input_socket.name}")
+                    # If not found by name, try first input
+                    if len(displacement_node.inputs) > 0:
+                        pending_links.append((
+                            color_output,
+                            displacement_node.inputs[0]
+                        ))
+                        tex_label.append(" →Input0")
+            
+            # Crea nodo Subdivision
+            subdivision_node = _new_node(node_tree, 'subdivision', _SUBDIVISION_NODE_TYPES)
+            if subdivision_node:
+                subdivision_node.location = (disney_x - 550, tex_y + 150)
+                subdivision_node.label = "Subdivision"
+            else:
+                print("Error creating Subdivision node: node type not available")
+            
+            # Collega Subdivision → Height Displacement (input Shape)
+            if subdivision_node:
+                shape_input_disp = _find_socket(displacement_in, displacement_in_lc, 'Shape', 'shape')
+                
+                if shape_input_disp:
+                    shape_output_subdiv = None
+                    for out in subdivision_node.outputs:
+                        if out.name == 'Shape' or 'shape' in out.name.lower():
+                            shape_output_subdiv = out
                             break
+                    if not shape_output_subdiv and len(subdivision_node.outputs) > 0:
+                        shape_output_subdiv = subdivision_node.outputs[0]
+                    
+                    if shape_output_subdiv:
+                        pending_links.append((shape_output_subdiv, shape_input_disp))
+                        tex_label.append(" +Subdiv")
             
-            # 3. AO (channel R/red) - output[0] - returned for multiplication with color
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 0:
-                ao_output = split_node.outputs[0]  # Channel R
-                print(f"DEBUG: Channel R (AO) ready for multiplication")
-                return ao_output
+            # Connect "Shape" output of Height Displacement node to Material Output
+            if material_output:
+                displacement_out = _index_sockets(displacement_node.outputs)[0]
+                # Find "Displacement" or "Shape" input in Material Output
+                output_input = next((material_in[input_name] for input_name in _OUTPUT_DISPLACEMENT_INPUT_NAMES
+                                     if input_name in material_in), None)
+                # Find "Shape" output in displacement node
+                if 'Shape' in displacement_out:
+                    if output_input:
+                        pending_links.append((
+                            displacement_out['Shape'],
+                            output_input
+                        ))
+                        tex_label.append(" →" + output_input.name)
+                    else:
+                        self.report({'WARNING'}, "Input for displacement not found in Material Output")
+                else:
+                    # If "Shape" not found, try other outputs
+                    displacement_output = next((displacement_out[output_name] for output_name in _DISPLACEMENT_OUTPUT_NAMES
+                                                if output_name in displacement_out), None)
+                    if displacement_output:
+                        if output_input:
+                            pending_links.append((
+                                displacement_output,
+                                output_input
+                            ))
+                            tex_label.append(" →" + output_input.name)
+                    else:
+                        self.report({'WARNING'}, "Cannot connect displacement to Material Output")
+                        tex_label.append(_LBL_NO_OUTPUT)
+            else:
+                self.report({'WARNING'}, "No Material Output found")
+                tex_label.append(_LBL_NO_OUTPUT)
+        else:
+            self.report({'ERROR'}, "Cannot create displacement node")
+            tex_label.append(" [No Disp Node]")
+        
+        return True
+    
+    def _connect_emission(self, tex_type, tex_node, tex_info, tex_y, tex_label):
+        """Connect an emission map through an intermediate Emission node"""
+        node_tree = self._node_tree
+        pending_links = self._pending_links
+        disney_in = self._disney_in
+        disney_in_lc = self._disney_in_lc
+        disney_x = self._disney_x
+        color_output = tex_node.outputs.get('Color')
+        
+        # Emission requires an intermediate Emission node (LuxCoreNodeMatEmission)
+        emission_node = _new_node(node_tree, 'emission', _EMISSION_NODE_TYPES)
+        if not emission_node:
+            self.report({'WARNING'}, "Cannot create Emission node: node type not available")
+            tex_label.append(" [No Emission Node]")
+            return False
+        
+        emission_node.location = (disney_x - 300, tex_y)
+        emission_node.label = "Emission"
+        
+        # Connect texture to Emission node Color input
+        if color_output:
+            color_input = None
+            for input_socket in emission_node.inputs:
+                if 'color' in input_socket.name.lower():
+                    color_input = input_socket
+                    break
             
-        except Exception as e:
-            print(f"DEBUG: Error in ORM configuration: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            if color_input:
+                pending_links.append((color_output, color_input))
+                tex_label.append(" →Emission")
         
-        return None
+        # Connect Emission node to Disney node Emission input
+        if len(emission_node.outputs) > 0:
+            emission_output = emission_node.outputs[0]
+            # Emission input, else alternative names
+            emission_input = _find_socket(disney_in, disney_in_lc, 'Emission', 'emission', 'emit')
+            if emission_input:
+                pending_links.append((emission_output, emission_input))
+        
+        return True
+    
+    def _connect_direct(self, tex_type, tex_node, tex_info, tex_y, tex_label):
+        """Connect the texture straight to the Disney socket of its type"""
+        pending_links = self._pending_links
+        disney_in = self._disney_in
+        color_output = tex_node.outputs.get('Color')
+        
+        if not tex_info['socket'] or tex_info['socket'] not in disney_in:
+            return True
+        
+        if color_output:
+            pending_links.append((
+                color_output,
+                disney_in[tex_info['socket']]
+            ))
+            tex_label.append(" →" + tex_info['socket'])
+        
+        return True
+    
+    def setup_orm_texture(self, node_tree, disney_node, orm_node, color_node, disney_in, disney_in_lc):
+        """Configure an ORM (OcclusionRoughnessMetallic) texture"""
+        return self._setup_split3_texture(node_tree, disney_node, orm_node, disney_in, disney_in_lc,
+                                          'ORM', 'Metallic', 'metal')
     
-    def setup_ors_texture(self, node_tree, disney_node, ors_node, color_node):
+    def setup_ors_texture(self, node_tree, disney_node, ors_node, color_node, disney_in, disney_in_lc):
         """Configure an ORS (OcclusionRoughnessSpecular) texture"""
+        return self._setup_split3_texture(node_tree, disney_node, ors_node, disney_in, disney_in_lc,
+                                          'ORS', 'Specular', 'spec')
+    
+    def _setup_split3_texture(self, node_tree, disney_node, tex_node, disney_in, disney_in_lc,
+                              kind, channel2_name, channel2_keyword):
+        """Split a packed AO/Roughness/<channel2_name> texture, returning the AO channel output"""
         try:
-            print(f"DEBUG: Configuring ORS texture: {ors_node.name}")
+            if _DEBUG:
+                print(f"DEBUG: Configuring {kind} texture: {tex_node.name}")
             
             # Create SplitFloat3 node
-            try:
-                split_node = node_tree.nodes.new(type="LuxCoreNodeTexSplitFloat3")
-                split_node.location = (disney_node.location.x - 400, ors_node.location.y)
-                split_node.label = "Split ORS"
-            except Exception as e:
-                print(f"DEBUG: Cannot create SplitFloat3 node: {str(e)}")
+            split_node = _new_node(node_tree, 'split', _SPLIT_NODE_TYPES)
+            if not split_node:
+                print("Error creating SplitFloat3 node: node type not available")
                 return None
+            split_node.location = (disney_node.location.x - 400, tex_node.location.y)
+            split_node.label = f"Split {kind}"
             
-            # Connect ORS texture to SplitFloat3 node
-            if hasattr(ors_node, 'outputs') and len(ors_node.outputs) > 0:
-                if hasattr(split_node, 'inputs') and len(split_node.inputs) > 0:
-                    # Use 'Color' output of ORS texture
+            # Connect packed texture to SplitFloat3 node
+            if len(tex_node.outputs) > 0:
+                if len(split_node.inputs) > 0:
+                    # Use 'Color' output of packed texture
                     color_output = None
-                    for output in ors_node.outputs:
+                    for output in tex_node.outputs:
                         if output.name.lower() in ['color', 'image', 'value']:
                             color_output = output
                             break
-                    if not color_output and len(ors_node.outputs) > 0:
-                        color_output = ors_node.outputs[0]
+                    if not color_output and len(tex_node.outputs) > 0:
+                        color_output = tex_node.outputs[0]
                     
                     if color_output:
-                        node_tree.links.new(color_output, split_node.inputs[0])
-                        print(f"DEBUG: ORS connected to SplitFloat3")
+                        self._pending_links.append((color_output, split_node.inputs[0]))
+                        if _DEBUG:
+                            print(f"DEBUG: {kind} connected to SplitFloat3")
             
             # Connect separate channels:
             # Channel G (1) -> Roughness
-            # Channel B (2) -> Specular
+            # Channel B (2) -> Metallic (ORM) or Specular (ORS)
             # Channel R (0) -> AO (multiply with color if exists)
             
             # 1. Roughness (channel G/green) - output[1]
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 1:
+            if len(split_node.outputs) > 1:
                 roughness_output = split_node.outputs[1]  # Channel G
-                if 'Roughness' in disney_node.inputs:
-                    node_tree.links.new(roughness_output, disney_node.inputs['Roughness'])
-                    print(f"DEBUG: Channel G (Roughness) connected")
-                else:
-                    # Try to find roughness socket with alternative names
-                    for input_socket in disney_node.inputs:
-                        if 'rough' in input_socket.name.lower():
-                            node_tree.links.new(roughness_output, input_socket)
-                            print(f"DEBUG: Channel G (Roughness) connected to {input_socket.name}")
-                            break
+                # Roughness socket, else alternative names
+                roughness_input = _find_socket(disney_in, disney_in_lc, 'Roughness', 'rough')
+                if roughness_input:
+                    self._pending_links.append((roughness_output, roughness_input))
+                    if _DEBUG:
+                        print(f"DEBUG: Channel G (Roughness) connected to {roughness_input.name}")
             
-            # 2. Specular (channel B/blue) - output[2]
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 2:
-                specular_output = split_node.outputs[2]  # Channel B
-                if 'Specular' in disney_node.inputs:
-                    node_tree.links.new(specular_output, disney_node.inputs['Specular'])
-                    print(f"DEBUG: Channel B (Specular) connected")
-                else:
-                    # Try to find specular socket with alternative names
-                    for input_socket in disney_node.inputs:
-                        if 'spec' in input_socket.name.lower():
-                            node_tree.links.new(specular_output, input_socket)
-                            print(f"DEBUG: Channel B (Specular) connected to {input_socket.name}")
-                            break
+            # 2. Metallic or Specular (channel B/blue) - output[2]
+            if len(split_node.outputs) > 2:
+                channel2_output = split_node.outputs[2]  # Channel B
+                # Channel socket, else alternative names
+                channel2_input = _find_socket(disney_in, disney_in_lc, channel2_name, channel2_keyword)
+                if channel2_input:
+                    self._pending_links.append((channel2_output, channel2_input))
+                    if _DEBUG:
+                        print(f"DEBUG: Channel B ({channel2_name}) connected to {channel2_input.name}")
             
             # 3. AO (channel R/red) - output[0] - returned for multiplication with color
-            if hasattr(split_node, 'outputs') and len(split_node.outputs) > 0:
+            if len(split_node.outputs) > 0:
                 ao_output = split_node.outputs[0]  # Channel R
-                print(f"DEBUG: Channel R (AO) ready for multiplication")
+                if _DEBUG:
+                    print("DEBUG: Channel R (AO) ready for multiplication")
                 return ao_output
             
         except Exception as e:
-            print(f"DEBUG: Error in ORS configuration: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            print(f"Error in {kind} configuration: {str(e)}")
+            if _DEBUG:
+                import traceback
+                traceback.print_exc()
         
         return None
     
     def organize_nodes(self, node_tree, disney_node, loaded_textures, mapping_node=None, material_output=None):
         """Organize nodes for better visualization"""
         # Position Disney node in center
-        disney_node.location = (0, 0)
+        placements = [(disney_node, (0, 0))]
         
         # Position mapping node if exists
         if mapping_node:
-            mapping_node.location = (-900, 0)
+            placements.append((mapping_node, (-900, 0)))
         
         # Position textures on the left
         x_start = -600
         y_start = 300
         
-        for i, tex in enumerate(loaded_textures):
-            tex_node = tex['node']
-            tex_node.location = (x_start, y_start - i * 280)
+        placements.extend((tex.node, (x_start, y_start - i * 280))
+                          for i, tex in enumerate(loaded_textures))
         
         # Position Material Output on the right
         if material_output:
-            material_output.location = (400, 0)
+            placements.append((material_output, (400, 0)))
+        
+        # Write every location once, without reading any back
+        for node, location in placements:
+            node.location = location
 
 # Context menu
 class NODE_MT_luxcore_pbr_menu(Menu):
@@ -1178,11 +1334,12 @@ class NODE_MT_luxcore_pbr_menu(Menu):
     
     def draw(self, context):
         layout = self.layout
+        op_idname = LUXCORE_OT_select_pbr_textures.bl_idname
         layout.operator_context = 'INVOKE_DEFAULT'
         
         # Main version
         op = layout.operator(
-            LUXCORE_OT_select_pbr_textures.bl_idname,
+            op_idname,
             text="Set Disney PBR Setup",
             icon='TEXTURE'
         )
@@ -1191,9 +1348,17 @@ class NODE_MT_luxcore_pbr_menu(Menu):
         
         layout.separator()
         
-        # Menu with advanced options
+        # Menu with advanced options, its entries are drawn only when the submenu opens
         layout.menu("NODE_MT_luxcore_pbr_advanced", text="Advanced Options", icon='SETTINGS')
 
+# (force_type, label, icon) entries at the end of the advanced menu
+_FORCED_TYPES = (
+    ('COLOR', "Color/Diffuse", 'MATERIAL'),
+    ('ROUGHNESS', "Roughness", 'NODE_TEXTURE'),
+    ('METALLIC', "Metallic", 'SHADING_WIRE'),
+    ('SPECULAR', "Specular", 'SHADING_SOLID'),
+)
+
 # Advanced menu
 class NODE_MT_luxcore_pbr_advanced(Menu):
     bl_label = "LuxCore PBR Advanced"
@@ -1201,10 +1366,11 @@ class NODE_MT_luxcore_pbr_advanced(Menu):
     
     def draw(self, context):
         layout = self.layout
+        op_idname = LUXCORE_OT_select_pbr_textures.bl_idname
         
         # Option with forced recognition for normal maps
         op = layout.operator(
-            LUXCORE_OT_select_pbr_textures.bl_idname,
+            op_idname,
             text="Force Normal Maps",
             icon='NORMALS_FACE'
         )
@@ -1213,7 +1379,7 @@ class NODE_MT_luxcore_pbr_advanced(Menu):
         
         # Option with forced recognition for displacement
         op = layout.operator(
-            LUXCORE_OT_select_pbr_textures.bl_idname,
+            op_idname,
             text="Force Displacement",
             icon='MOD_DISPLACE'
         )
@@ -1222,7 +1388,7 @@ class NODE_MT_luxcore_pbr_advanced(Menu):
         
         # Option with forced recognition for AO
         op = layout.operator(
-            LUXCORE_OT_select_pbr_textures.bl_idname,
+            op_idname,
             text="Force AO",
             icon='LIGHT_HEMI'
         )
@@ -1231,7 +1397,7 @@ class NODE_MT_luxcore_pbr_advanced(Menu):
         
         # Option with forced recognition for ORM
         op = layout.operator(
-            LUXCORE_OT_select_pbr_textures.bl_idname,
+            op_idname,
             text="Force ORM",
             icon='NODE_TEXTURE'
         )
@@ -1240,7 +1406,7 @@ class NODE_MT_luxcore_pbr_advanced(Menu):
         
         # Option with forced recognition for ORS
         op = layout.operator(
-            LUXCORE_OT_select_pbr_textures.bl_idname,
+            op_idname,
             text="Force ORS",
             icon='NODE_TEXTURE'
         )
@@ -1248,22 +1414,25 @@ class NODE_MT_luxcore_pbr_advanced(Menu):
         op.auto_connect = True
         
         # Other forced options
-        types = [
-            ('COLOR', "Color/Diffuse", 'MATERIAL'),
-            ('ROUGHNESS', "Roughness", 'NODE_TEXTURE'),
-            ('METALLIC', "Metallic", 'SHADING_WIRE'),
-            ('SPECULAR', "Specular", 'SHADING_SOLID'),
-        ]
-        
-        for type_id, label, icon in types:
+        for type_id, label, icon in _FORCED_TYPES:
             op = layout.operator(
-                LUXCORE_OT_select_pbr_textures.bl_idname,
+                op_idname,
                 text=label,
                 icon=icon
             )
             op.force_type = type_id
             op.auto_connect = True
 
+# Lines of the Info section in the side panel
+_INFO_LINES = (
+    "1. All textures share the same UV Mapping",
+    "2. Normal Map: 'Normalmap' checkbox automatically activated",
+    "3. Displacement: Height → Height Displacement → Shape",
+    "4. Displacement scale automatically set to 0.02",
+    "5. ORM/ORS: channels automatically split",
+    "6. AO: Color + AO → Math(Multiply) → Base Color",
+)
+
 # Side panel
 class NODE_PT_luxcore_pbr_panel(Panel):
     bl_label = "LuxCore PBR Setup"
@@ -1278,76 +1447,78 @@ class NODE_PT_luxcore_pbr_panel(Panel):
     
     def draw(self, context):
         layout = self.layout
+        op_idname = LUXCORE_OT_select_pbr_textures.bl_idname
         
         # Main button
         box = layout.box()
         box.label(text="Quick Setup:", icon='LIGHT')
         
         op = box.operator(
-            LUXCORE_OT_select_pbr_textures.bl_idname,
+            op_idname,
             text="Load & Connect Textures",
             icon='FILE_FOLDER'
         )
         op.auto_connect = True
         op.force_type = 'AUTO'
         
-        # Info
-        box = layout.box()
-        box.label(text="Info:", icon='INFO')
-        box.label(text="1. All textures share the same UV Mapping")
-        box.label(text="2. Normal Map: 'Normalmap' checkbox automatically activated")
-        box.label(text="3. Displacement: Height → Height Displacement → Shape")
-        box.label(text="4. Displacement scale automatically set to 0.02")
-        box.label(text="5. ORM/ORS: channels automatically split")
-        box.label(text="6. AO: Color + AO → Math(Multiply) → Base Color")
+        # Info, collapsed by default so the lines are drawn only when opened
+        header, body = layout.panel("luxcore_pbr_info", default_closed=True)
+        header.label(text="Info:", icon='INFO')
+        if body:
+            for line in _INFO_LINES:
+                body.label(text=line)
 
 # Add to context menu (only when a Disney node is selected)
 def draw_luxcore_pbr_menu(self, context):
     """Show LuxCore PBR menu only when a Disney node is selected"""
-    # Check if rendering engine is LuxCore
-    if context.engine != 'LUXCORE':
+    # Check if we are in node editor and rendering engine is LuxCore
+    node_tree = getattr(context.space_data, 'node_tree', None)
+    if node_tree is None or context.engine != 'LUXCORE':
         return
     
-    # Check if we are in node editor
-    if not context.space_data or not context.space_data.node_tree:
-        return
-    
-    node_tree = context.space_data.node_tree
+    # Check if active node is a LuxCore Disney node
     active_node = node_tree.nodes.active
-    
-    if not active_node:
+    if active_node is None or active_node.bl_idname not in _DISNEY_NODE_TYPES:
         return
     
-    # Check if active node is a LuxCore Disney node
-    disney_node_types = [
-        'LuxCoreNodeMatDisney',
-        'LuxCoreNodeMatDisney2',
-        'luxcore_material_disney'
-    ]
-    
-    if active_node.bl_idname in disney_node_types:
-        layout = self.layout
-        layout.separator()
-        layout.menu("NODE_MT_luxcore_pbr_menu")
+    layout = self.layout
+    layout.separator()
+    layout.menu("NODE_MT_luxcore_pbr_menu")
 
 # Registration
+_classes = (
+    LUXCORE_OT_select_pbr_textures,
+    NODE_MT_luxcore_pbr_menu,
+    NODE_MT_luxcore_pbr_advanced,
+    NODE_PT_luxcore_pbr_panel,
+)
+# Only the register half of the factory is used: its unregister stops at the first
+# class that is not registered, which after a partial register() would leave the
+# classes before it registered, so unregister() walks _classes itself
+_register_classes = bpy.utils.register_classes_factory(_classes)[0]
+
 def register():
-    bpy.utils.register_class(LUXCORE_OT_select_pbr_textures)
-    bpy.utils.register_class(NODE_MT_luxcore_pbr_menu)
-    bpy.utils.register_class(NODE_MT_luxcore_pbr_advanced)
-    bpy.utils.register_class(NODE_PT_luxcore_pbr_panel)
+    # Collect the registered node types again on the next lookup
+    _available_node_types.cache_clear()
+    _RESOLVED.clear()
+    
+    _register_classes()
     
+    # Right click menu only, as in bl_info location
     bpy.types.NODE_MT_context_menu.append(draw_luxcore_pbr_menu)
-    bpy.types.NODE_MT_node.append(draw_luxcore_pbr_menu)
 
 def unregister():
-    bpy.utils.unregister_class(LUXCORE_OT_select_pbr_textures)
-    bpy.utils.unregister_class(NODE_MT_luxcore_pbr_menu)
-    bpy.utils.unregister_class(NODE_MT_luxcore_pbr_advanced)
-    bpy.utils.unregister_class(NODE_PT_luxcore_pbr_panel)
+    # Clean up whatever was registered, even after a partial register()
+    for cls in reversed(_classes):
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            pass
     
-    bpy.types.NODE_MT_context_menu.remove(draw_luxcore_pbr_menu)
-    bpy.types.NODE_MT_node.remove(draw_luxcore_pbr_menu)
+    try:
+        bpy.types.NODE_MT_context_menu.remove(draw_luxcore_pbr_menu)
+    except (ValueError, AttributeError):
+        pass
 
 if __name__ == "__main__":
     register()
@@ -14,6 +14,126 @@ import re
 from bpy.types import Operator, Menu
 from bpy.props import BoolProperty
 
+_TEXTURE_NODE_TYPES = frozenset((
+    'LuxCoreNodeTexImagemap',
+    'LuxCoreNodeTexImage',
+    'ShaderNodeTexImage',
+))
+
+_DISNEY_NODE_TYPES = frozenset((
+    'LuxCoreNodeMatDisney',
+    'LuxCoreNodeMatDisney2',
+    'luxcore_material_disney',
+))
+
+# Texture types already provided by an ORM/ORS texture
+_PACKED_CHANNEL_TYPES = frozenset(('metallic', 'roughness', 'ao', 'specular'))
+
+# Texture types with their own connection, the others go straight to their socket
+_DEDICATED_TYPES = frozenset(('color', 'ao', 'normal', 'bump', 'height', 'emission'))
+
+# Disney inputs tried for normal and bump maps, in order
+_NORMAL_SOCKET_NAMES = ('Bump', 'bump', 'Normal', 'normal')
+
+# Mapping input keywords in the texture (lowercase) and output names in the mapping node
+_MAPPING_INPUT_KEYS = ('2d mapping', 'mapping', 'uv', 'uv map', 'uvs', 'vector')
+_MAPPING_OUTPUT_NAMES = ('2D Mapping', 'Mapping', 'UV', 'Vector', 'Output')
+
+# Texture types recognized from node and image names
+_TEXTURE_MAPPING = {
+    'orm': {
+        'keywords': ('orm', 'arm', 'mro',
+                     'metallicroughness', 'roughnessmetallic',
+                     'occlusionroughnessmetallic', 'ambientroughnessmetallic'),
+        'is_orm': True,
+        'priority': 12
+    },
+    'ors': {
+        'keywords': ('ors', 'occlusionroughnessspecular', 'roughnessspecularocclusion',
+                     'specularroughnessocclusion', 'ambientroughnessspecular',
+                     'occlusionroughnessgloss', 'roughnessglossocclusion'),
+        'is_ors': True,
+        'priority': 11
+    },
+    'color': {
+        'keywords': ('color', 'diff', 'diffuse', 'albedo', 'basecolor', 'col', 'base'),
+        'socket': 'Base Color',
+        'priority': 9
+    },
+    'emission': {
+        'keywords': ('emission', 'emit', 'emissive', 'emiss', 'glow', 'light'),
+        'socket': 'Emission',
+        'is_emission': True,
+        'priority': 10
+    },
+    'normal': {
+        'keywords': ('normal', 'norm', 'nrm', 'nor', 'normalmap', 'normal_map', 'normalgl', 'normaldx'),
+        'socket': 'Bump',
+        'is_normal': True,
+        'priority': 8
+    },
+    'bump': {
+        'keywords': ('bump', 'bmp', 'bump_map', 'bumpmap'),
+        'socket': 'Bump',
+        'is_bump': True,
+        'priority': 7
+    },
+    'metallic': {
+        'keywords': ('metal', 'metallic', 'metalness', 'mtl', 'met'),
+        'socket': 'Metallic',
+        'priority': 6
+    },
+    'roughness': {
+        'keywords': ('rough', 'roughness', 'rgh', 'rug'),
+        'socket': 'Roughness',
+        'priority': 5
+    },
+    'specular': {
+        'keywords': ('spec', 'specular', 'specularity', 'spc'),
+        'socket': 'Specular',
+        'priority': 4
+    },
+    'height': {
+        'keywords': ('height', 'disp', 'displacement', 'heightmap'),
+        'socket': 'Height',
+        'is_height': True,
+        'priority': 3
+    },
+    'opacity': {
+        'keywords': ('opacity', 'alpha', 'transparency', 'transparent', 'mask'),
+        'socket': 'Opacity',
+        'priority': 2
+    },
+    'ao': {
+        'keywords': ('ao', 'ambientocclusion', 'occlusion', 'ambient'),
+        'is_ao': True,
+        'priority': 1
+    }
+}
+
+# Priority of every texture type
+_PRIORITY_BY_TYPE = {tex_type: tex_info.get('priority', 0) for tex_type, tex_info in _TEXTURE_MAPPING.items()}
+
+# Priority and texture type of every keyword, looked up by whole word
+_KEYWORD_INDEX = {
+    keyword: (_PRIORITY_BY_TYPE[tex_type], tex_type, tex_info)
+    for tex_type, tex_info in _TEXTURE_MAPPING.items()
+    for keyword in tex_info['keywords']
+}
+
+# Separators between the words of a lowercase name
+_WORD_SPLIT_RE = re.compile(r'[^a-z0-9]+')
+
+# Output names that carry the color of a texture node
+_COLOR_OUT_NAMES = frozenset(('color', 'image', 'value'))
+
+def _pick_color_output(tex_node):
+    """Return the Color/Image/Value output of a texture node, or its first output"""
+    for output in tex_node.outputs:
+        if output.name.lower() in _COLOR_OUT_NAMES:
+            return output
+    return tex_node.outputs[0] if len(tex_node.outputs) > 0 else None
+
 class LUXCORE_OT_connect_existing_textures(Operator):
     """Automatically connect existing textures to the Disney node"""
     bl_idname = "luxcore.connect_existing_textures"
@@ -36,22 +156,13 @@ class LUXCORE_OT_connect_existing_textures(Operator):
             return False
         
         active_node = node_tree.nodes.active
-        disney_node_types = [
-            'LuxCoreNodeMatDisney',
-            'LuxCoreNodeMatDisney2',
-            'luxcore_material_disney'
-        ]
-        
-        return active_node.bl_idname in disney_node_types
+        return active_node.bl_idname in _DISNEY_NODE_TYPES
     
     def execute(self, context):
         node_tree = context.space_data.node_tree
         disney_node = node_tree.nodes.active
         
-        texture_nodes = []
-        for node in node_tree.nodes:
-            if node.bl_idname in ['LuxCoreNodeTexImagemap', 'LuxCoreNodeTexImage', 'ShaderNodeTexImage']:
-                texture_nodes.append(node)
+        texture_nodes = [node for node in node_tree.nodes if node.bl_idname in _TEXTURE_NODE_TYPES]
         
         if not texture_nodes:
             self.report({'WARNING'}, "No texture nodes found in the node tree")
@@ -121,77 +232,6 @@ class LUXCORE_OT_connect_existing_textures(Operator):
         """Connect textures to the Disney material based on naming conventions"""
         connected_count = 0
         
-        texture_mapping = {
-            'orm': {
-                'keywords': ['orm', 'arm', 'mro',
-                           'metallicroughness', 'roughnessmetallic',
-                           'occlusionroughnessmetallic', 'ambientroughnessmetallic'],
-                'is_orm': True,
-                'priority': 12
-            },
-            'ors': {
-                'keywords': ['ors', 'occlusionroughnessspecular', 'roughnessspecularocclusion',
-                           'specularroughnessocclusion', 'ambientroughnessspecular',
-                           'occlusionroughnessgloss', 'roughnessglossocclusion'],
-                'is_ors': True,
-                'priority': 11
-            },
-            'color': {
-                'keywords': ['color', 'diff', 'diffuse', 'albedo', 'basecolor', 'col', 'base'],
-                'socket': 'Base Color',
-                'priority': 9
-            },
-            'emission': {
-                'keywords': ['emission', 'emit', 'emissive', 'emiss', 'glow', 'light'],
-                'socket': 'Emission',
-                'is_emission': True,
-                'priority': 10
-            },
-            'normal': {
-                'keywords': ['normal', 'norm', 'nrm', 'nor', 'normalmap', 'normal_map', 'normalgl', 'normaldx'],
-                'socket': 'Bump',
-                'is_normal': True,
-                'priority': 8
-            },
-            'bump': {
-                'keywords': ['bump', 'bmp', 'bump_map', 'bumpmap'],
-                'socket': 'Bump',
-                'is_bump': True,
-                'priority': 7
-            },
-            'metallic': {
-                'keywords': ['metal', 'metallic', 'metalness', 'mtl', 'met'],
-                'socket': 'Metallic',
-                'priority': 6
-            },
-            'roughness': {
-                'keywords': ['rough', 'roughness', 'rgh', 'rug'],
-                'socket': 'Roughness',
-                'priority': 5
-            },
-            'specular': {
-                'keywords': ['spec', 'specular', 'specularity', 'spc'],
-                'socket': 'Specular',
-                'priority': 4
-            },
-            'height': {
-                'keywords': ['height', 'disp', 'displacement', 'heightmap'],
-                'socket': 'Height',
-                'is_height': True,
-                'priority': 3
-            },
-            'opacity': {
-                'keywords': ['opacity', 'alpha', 'transparency', 'transparent', 'mask'],
-                'socket': 'Opacity',
-                'priority': 2
-            },
-            'ao': {
-                'keywords': ['ao', 'ambientocclusion', 'occlusion', 'ambient'],
-                'is_ao': True,
-                'priority': 1
-            }
-        }
-        
         texture_info_list = []
         
         # Prima passata: identificare tutte le texture
@@ -203,24 +243,18 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                 image_name = tex_node.image.name.lower()
             
             search_text = node_name + " " + image_name
-            best_match = None
-            best_priority = -1
-            
-            for tex_type, tex_info in texture_mapping.items():
-                for keyword in tex_info['keywords']:
-                    pattern = r'(^|[^a-zA-Z0-9])' + re.escape(keyword) + r'($|[^a-zA-Z0-9])'
-                    if re.search(pattern, search_text, re.IGNORECASE):
-                        if tex_info.get('priority', 0) > best_priority:
-                            best_priority = tex_info.get('priority', 0)
-                            best_match = (tex_type, tex_info)
-                        break
+            best_match = max(
+                (_KEYWORD_INDEX[word] for word in _WORD_SPLIT_RE.split(search_text) if word in _KEYWORD_INDEX),
+                default=None,
+                key=lambda entry: entry[0]
+            )
             
             if best_match:
-                tex_type, tex_info = best_match
+                _, tex_type, tex_info = best_match
                 texture_info_list.append((tex_node, tex_type, tex_info))
                 print(f"Texture identified: {tex_node.name} -> {tex_type}")
         
-        texture_info_list.sort(key=lambda x: texture_mapping[x[1]].get('priority', 0), reverse=True)
+        texture_info_list.sort(key=lambda x: _PRIORITY_BY_TYPE[x[1]], reverse=True)
         
         # Variabili per nodi speciali
         color_node = None
@@ -236,10 +270,13 @@ class LUXCORE_OT_connect_existing_textures(Operator):
         # Seconda passata: elaborazione delle texture
         for tex_node, tex_type, tex_info in texture_info_list:
             # Controlla se questo tipo è già coperto da ORM/ORS
-            if tex_type in ['metallic', 'roughness', 'ao', 'specular'] and tex_type in covered_types:
+            if tex_type in _PACKED_CHANNEL_TYPES and tex_type in covered_types:
                 print(f"Texture {tex_type} ({tex_node.name}) ignorata perché già coperta da ORM/ORS")
                 continue
             
+            # Output Color della texture, cercato una sola volta
+            color_output = _pick_color_output(tex_node)
+            
             try:
                 if mapping_node and self.create_uv_node:
                     self.connect_mapping_to_texture(node_tree, mapping_node, tex_node)
@@ -282,12 +319,10 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                     tex_node.label = f"NORMAL: {tex_node.label or tex_node.name}"
                     
                     # PRIMA: collega la normal map al socket Bump
-                    if hasattr(tex_node, 'outputs') and len(tex_node.outputs) > 0:
+                    if color_output:
                         # Trova il socket Bump nel nodo Disney
                         socket_found = None
-                        socket_names_to_try = ['Bump', 'bump', 'Normal', 'normal']
-                        
-                        for socket_name in socket_names_to_try:
+                        for socket_name in _NORMAL_SOCKET_NAMES:
                             if socket_name in material_node.inputs:
                                 socket_found = material_node.inputs[socket_name]
                                 break
@@ -302,21 +337,12 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                         
                         if socket_found:
                             # Usa l'output Color della texture
-                            color_output = None
-                            for output in tex_node.outputs:
-                                if output.name.lower() in ['color', 'image', 'value']:
-                                    color_output = output
-                                    break
-                            if not color_output and len(tex_node.outputs) > 0:
-                                color_output = tex_node.outputs[0]
+                            node_tree.links.new(color_output, socket_found)
+                            connected_count += 1
+                            tex_node.label += " →Bump"
                             
-                            if color_output:
-                                node_tree.links.new(color_output, socket_found)
-                                connected_count += 1
-                                tex_node.label += " →Bump"
-                                
-                                # SOLO DOPO aver collegato: attiva la checkbox Normalmap
-                                self.activate_normal_map(tex_node)
+                            # SOLO DOPO aver collegato: attiva la checkbox Normalmap
+                            self.activate_normal_map(tex_node)
                 
                 elif tex_type == 'bump':
                     # Bump map richiede un nodo intermedio LuxCoreNodeTexBump
@@ -336,35 +362,21 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                         connected_count += 1
                         tex_node.label = f"EMISSION: {tex_node.label or tex_node.name}"
                 
-                elif tex_type not in ['color', 'ao', 'normal', 'bump', 'height', 'emission'] and tex_info['socket'] and tex_info['socket'] in material_node.inputs:
-                    if hasattr(tex_node, 'outputs') and len(tex_node.outputs) > 0:
-                        # Usa l'output Color della texture
-                        color_output = None
-                        for output in tex_node.outputs:
-                            if output.name.lower() in ['color', 'image', 'value']:
-                                color_output = output
-                                break
-                        if not color_output and len(tex_node.outputs) > 0:
-                            color_output = tex_node.outputs[0]
-                        
-                        if color_output:
-                            node_tree.links.new(color_output, material_node.inputs[tex_info['socket']])
-                            connected_count += 1
-                            tex_node.label = f"{tex_type.upper()}: {tex_node.label or tex_node.name} →{tex_info['socket']}"
+                elif tex_type not in _DEDICATED_TYPES and tex_info['socket'] and tex_info['socket'] in material_node.inputs:
+                    # Usa l'output Color della texture
+                    if color_output:
+                        node_tree.links.new(color_output, material_node.inputs[tex_info['socket']])
+                        connected_count += 1
+                        tex_node.label = f"{tex_type.upper()}: {tex_node.label or tex_node.name} →{tex_info['socket']}"
                 
             except Exception as e:
                 print(f"Error connecting texture {tex_node.name}: {e}")
         
         # Setup per AO (Ambient Occlusion)
         ao_channel = None
-        if ao_node and hasattr(ao_node, 'outputs') and len(ao_node.outputs) > 0:
+        if ao_node and len(ao_node.outputs) > 0:
             # Usa l'output Color della texture AO
-            for output in ao_node.outputs:
-                if output.name.lower() in ['color', 'image', 'value']:
-                    ao_channel = output
-                    break
-            if not ao_channel and len(ao_node.outputs) > 0:
-                ao_channel = ao_node.outputs[0]
+            ao_channel = _pick_color_output(ao_node)
         
         elif orm_ao_channel:
             ao_channel = orm_ao_channel
@@ -377,19 +389,11 @@ class LUXCORE_OT_connect_existing_textures(Operator):
             connected_count += 1
         elif color_node:
             # Collega solo la texture di colore
-            if hasattr(color_node, 'outputs') and len(color_node.outputs) > 0:
-                color_output = None
-                for output in color_node.outputs:
-                    if output.name.lower() in ['color', 'image', 'value']:
-                        color_output = output
-                        break
-                if not color_output and len(color_node.outputs) > 0:
-                    color_output = color_node.outputs[0]
-                
-                if color_output and 'Base Color' in material_node.inputs:
-                    node_tree.links.new(color_output, material_node.inputs['Base Color'])
-                    color_node.label += " →Base Color"
-                    connected_count += 1
+            color_output = _pick_color_output(color_node)
+            if color_output and 'Base Color' in material_node.inputs:
+                node_tree.links.new(color_output, material_node.inputs['Base Color'])
+                color_node.label += " →Base Color"
+                connected_count += 1
         
         return connected_count
     
@@ -399,15 +403,12 @@ class LUXCORE_OT_connect_existing_textures(Operator):
             if hasattr(mapping_node, 'outputs') and len(mapping_node.outputs) > 0:
                 if hasattr(tex_node, 'inputs') and len(tex_node.inputs) > 0:
                     # Cerca input di mapping
-                    mapping_inputs = ['2D Mapping', 'Mapping', 'UV', 'UV Map', 'UVs', 'Vector']
-                    
                     for input_socket in tex_node.inputs:
                         input_name = input_socket.name.lower()
-                        for map_input in mapping_inputs:
-                            if map_input.lower() in input_name:
+                        for map_input in _MAPPING_INPUT_KEYS:
+                            if map_input in input_name:
                                 # Cerca output di mapping
-                                mapping_outputs = ['2D Mapping', 'Mapping', 'UV', 'Vector', 'Output']
-                                for output_name in mapping_outputs:
+                                for output_name in _MAPPING_OUTPUT_NAMES:
                                     if output_name in mapping_node.outputs:
                                         node_tree.links.new(
                                             mapping_node.outputs[output_name],
@@ -489,32 +490,24 @@ class LUXCORE_OT_connect_existing_textures(Operator):
             emission_node.label = "Emission"
             
             # Connect texture to Color pin of Emission node
-            if hasattr(tex_node, 'outputs') and len(tex_node.outputs) > 0:
-                color_output = None
-                for output in tex_node.outputs:
-                    if output.name.lower() in ['color', 'image', 'value']:
-                        color_output = output
+            color_output = _pick_color_output(tex_node)
+            if color_output and hasattr(emission_node, 'inputs'):
+                # Find Color input in Emission node
+                color_input = None
+                for input_socket in emission_node.inputs:
+                    if 'color' in input_socket.name.lower():
+                        color_input = input_socket
                         break
-                if not color_output:
-                    color_output = tex_node.outputs[0]
                 
-                if color_output and hasattr(emission_node, 'inputs'):
-                    # Find Color input in Emission node
-                    color_input = None
-                    for input_socket in emission_node.inputs:
-                        if 'color' in input_socket.name.lower():
-                            color_input = input_socket
-                            break
+                if color_input:
+                    node_tree.links.new(color_output, color_input)
                     
-                    if color_input:
-                        node_tree.links.new(color_output, color_input)
-                        
-                        # Set sRGB gamma for emission (it's a color)
-                        if hasattr(tex_node, 'color_space'):
-                            tex_node.color_space = 'sRGB'
-                    else:
-                        print("Color input not found in Emission node")
-                        return False
+                    # Set sRGB gamma for emission (it's a color)
+                    if hasattr(tex_node, 'color_space'):
+                        tex_node.color_space = 'sRGB'
+                else:
+                    print("Color input not found in Emission node")
+                    return False
             
             # Connect Emission node to Emission pin of Disney node
             if hasattr(emission_node, 'outputs') and len(emission_node.outputs) > 0:
@@ -575,29 +568,21 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                                 pass
             
             # Connect texture Color output to Bump node Value input
-            if hasattr(tex_node, 'outputs') and len(tex_node.outputs) > 0:
-                color_output = None
-                for output in tex_node.outputs:
-                    if output.name.lower() in ['color', 'image', 'value']:
-                        color_output = output
+            color_output = _pick_color_output(tex_node)
+            if color_output and hasattr(bump_node, 'inputs'):
+                # Find Value input in Bump node
+                value_input = None
+                for inp in bump_node.inputs:
+                    if 'value' in inp.name.lower():
+                        value_input = inp
                         break
-                if not color_output:
-                    color_output = tex_node.outputs[0]
                 
-                if color_output and hasattr(bump_node, 'inputs'):
-                    # Find Value input in Bump node
-                    value_input = None
-                    for inp in bump_node.inputs:
-                        if 'value' in inp.name.lower():
-                            value_input = inp
-                            break
-                    
-                    if value_input:
-                        node_tree.links.new(color_output, value_input)
-                        print(f"Connected texture to Bump node Value input")
-                    else:
-                        print("Value input not found in Bump node")
-                        return False
+                if value_input:
+                    node_tree.links.new(color_output, value_input)
+                    print(f"Connected texture to Bump node Value input")
+                else:
+                    print("Value input not found in Bump node")
+                    return False
             
             # NOTE: 2D Mapping should be connected to the TEXTURE node, not the Bump node
             # The mapping is already connected to the texture before calling setup_bump
@@ -613,10 +598,8 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                     bump_output = bump_node.outputs[0]
                 
                 # Find Bump input in material node
-                socket_names_to_try = ['Bump', 'bump', 'Normal', 'normal']
                 socket_found = None
-                
-                for socket_name in socket_names_to_try:
+                for socket_name in _NORMAL_SOCKET_NAMES:
                     if socket_name in material_node.inputs:
                         socket_found = material_node.inputs[socket_name]
                         break
@@ -657,19 +640,10 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                 return None
             
             # Connect combined texture to SplitFloat3 node
-            if hasattr(combined_node, 'outputs') and len(combined_node.outputs) > 0:
-                if hasattr(split_node, 'inputs') and len(split_node.inputs) > 0:
-                    color_output = None
-                    for output in combined_node.outputs:
-                        if output.name.lower() in ['color', 'image', 'value']:
-                            color_output = output
-                            break
-                    if not color_output and len(combined_node.outputs) > 0:
-                        color_output = combined_node.outputs[0]
-                    
-                    if color_output:
-                        node_tree.links.new(color_output, split_node.inputs[0])
-                        print(f"DEBUG: {tex_type.upper()} connected to SplitFloat3")
+            color_output = _pick_color_output(combined_node)
+            if color_output and len(split_node.inputs) > 0:
+                node_tree.links.new(color_output, split_node.inputs[0])
+                print(f"DEBUG: {tex_type.upper()} connected to SplitFloat3")
             
             # Set texture to Non-Color
             if hasattr(combined_node, 'color_space'):
@@ -796,20 +770,12 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                 if hasattr(displacement_node, 'inputs') and len(displacement_node.inputs) > 0:
                     # Trova input Height
                     input_names = ['Height', 'height', 'Displacement', 'displacement', 'Texture', 'texture']
+                    color_output = _pick_color_output(height_node)
                     for input_name in input_names:
                         if input_name in displacement_node.inputs:
-                            color_output = None
-                            for output in height_node.outputs:
-                                if output.name.lower() in ['color', 'image', 'value']:
-                                    color_output = output
-                                    break
-                            if not color_output and len(height_node.outputs) > 0:
-                                color_output = height_node.outputs[0]
-                            
-                            if color_output:
-                                node_tree.links.new(color_output, displacement_node.inputs[input_name])
-                                height_node.label += " →Height"
-                                break
+                            node_tree.links.new(color_output, displacement_node.inputs[input_name])
+                            height_node.label += " →Height"
+                            break
             
             # Crea nodo Subdivision
             subdivision_node = None
@@ -866,6 +832,8 @@ class LUXCORE_OT_connect_existing_textures(Operator):
     def setup_ao_multiply(self, node_tree, material_node, color_node, ao_channel, ao_node):
         """Create Math node to multiply Color with AO"""
         try:
+            color_output = _pick_color_output(color_node)
+            
             # Crea nodo Math per moltiplicazione
             math_node_types = [
                 'LuxCoreNodeTexMath',
@@ -908,13 +876,6 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                         input_name = input_socket.name.lower()
                         # Primo input (color)
                         if not color_connected and ('value1' in input_name or 'input1' in input_name or 'a' in input_name or 'color1' in input_name or i == 0):
-                            color_output = None
-                            for output in color_node.outputs:
-                                if output.name.lower() in ['color', 'image', 'value']:
-                                    color_output = output
-                                    break
-                            if not color_output and len(color_node.outputs) > 0:
-                                color_output = color_node.outputs[0]
                             
                             if color_output:
                                 node_tree.links.new(color_output, input_socket)
@@ -929,13 +890,6 @@ class LUXCORE_OT_connect_existing_textures(Operator):
                 
                 # Se non trovato per nome, usa i primi due input
                 if not color_connected and len(math_node.inputs) > 0:
-                    color_output = None
-                    for output in color_node.outputs:
-                        if output.name.lower() in ['color', 'image', 'value']:
-                            color_output = output
-                            break
-                    if not color_output and len(color_node.outputs) > 0:
-                        color_output = color_node.outputs[0]
                     
                     if color_output:
                         node_tree.links.new(color_output, math_node.inputs[0])
@@ -975,13 +929,6 @@ class LUXCORE_OT_connect_existing_textures(Operator):
             else:
                 print("Math node not available. AO connection not possible.")
                 # Collega solo la texture di colore
-                color_output = None
-                for output in color_node.outputs:
-                    if output.name.lower() in ['color', 'image', 'value']:
-                        color_output = output
-                        break
-                if not color_output and len(color_node.outputs) > 0:
-                    color_output = color_node.outputs[0]
                 
                 if color_output and 'Base Color' in material_node.inputs:
                     node_tree.links.new(color_output, material_node.inputs['Base Color'])
@@ -990,13 +937,7 @@ class LUXCORE_OT_connect_existing_textures(Operator):
         except Exception as e:
             print(f"Error creating Math node for AO: {str(e)}")
             # In caso di errore, collega solo la texture di colore
-            color_output = None
-            for output in color_node.outputs:
-                if output.name.lower() in ['color', 'image', 'value']:
-                    color_output = output
-                    break
-            if not color_output and len(color_node.outputs) > 0:
-                color_output = color_node.outputs[0]
+            color_output = _pick_color_output(color_node)
             
             if color_output and 'Base Color' in material_node.inputs:
                 node_tree.links.new(color_output, material_node.inputs['Base Color'])
@@ -1036,13 +977,7 @@ def draw_luxcore_connect_menu(self, context):
     if not active_node:
         return
     
-    disney_node_types = [
-        'LuxCoreNodeMatDisney',
-        'LuxCoreNodeMatDisney2',
-        'luxcore_material_disney'
-    ]
-    
-    if active_node.bl_idname in disney_node_types:
+    if active_node.bl_idname in _DISNEY_NODE_TYPES:
         layout = self.layout
         layout.separator()
         layout.operator(